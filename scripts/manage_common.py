@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Funções compartilhadas pelos scripts manage_*.
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(data: Any) -> bytes:
+    """
+    Serializa dados em JSON compacto (UTF-8), usando orjson se disponível.
+
+    Args:
+        data: Dados a serializar.
+
+    Returns:
+        Bytes com o JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Interpreta um documento JSON, usando orjson se disponível.
+
+    Args:
+        data: Conteúdo JSON.
+
+    Returns:
+        Dados interpretados.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(data: Dict) -> bytes:
+    """
+    Serializa um dicionário em JSON indentado (UTF-8), usando orjson se disponível.
+
+    Args:
+        data: Dicionário a serializar.
+
+    Returns:
+        Bytes com o JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Lê um arquivo JSON, usando orjson se disponível.
+
+    Args:
+        path: Caminho do arquivo.
+
+    Returns:
+        Conteúdo do arquivo.
+    """
+    return loads(Path(path).read_bytes())
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Grava um arquivo de forma atômica.
+
+    O conteúdo vai para um arquivo temporário ao lado do destino, que então o
+    substitui; uma interrupção nunca deixa o arquivo gravado pela metade. As
+    permissões de um arquivo existente são mantidas, e o temporário é removido
+    se a gravação falhar.
+
+    Args:
+        path: Caminho do arquivo.
+        data: Conteúdo a gravar.
+    """
+    path = os.fspath(path)
+    tmp_path = f'{path}.tmp'
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Sem arquivo anterior, o modo padrão respeita a umask
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -5,13 +5,19 @@
 Script para gerenciar as configurações do emulador.
 """
 
+import copy
+import io
 import json
+import math
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache, reduce
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from manage_common import atomic_write_bytes, dump_json, dumps, loads, read_json
+
 # Configurações padrão
 DEFAULT_SETTINGS = {
     'video': {
@@ -76,6 +82,78 @@ DEFAULT_SETTINGS = {
     }
 }
 
+# Configurações padrão serializadas uma única vez; cópias profundas saem daqui
+_DEFAULT_BYTES = dumps(DEFAULT_SETTINGS)
+
+# Seções obrigatórias do arquivo de configurações
+_REQUIRED_SECTIONS = ('video', 'audio', 'input', 'system', 'ui', 'debug')
+
+# Valores permitidos para as opções enumeradas
+_ASPECT_RATIOS = frozenset({'original', 'stretch', '4:3', '16:9'})
+_FILTERS = frozenset({'nearest', 'linear', 'bicubic'})
+_RESAMPLING_QUALITY = frozenset({'low', 'medium', 'high'})
+_REGIONS = frozenset({'auto', 'jp', 'us', 'eu'})
+_LOG_LEVELS = frozenset({'debug', 'info', 'warning', 'error'})
+
+# Tabela de validação: (caminho, tipo ou valores permitidos, mensagem de erro)
+_SCHEMA = (
+    (('video', 'resolution'), dict, 'Resolução inválida'),
+    (('video', 'resolution', 'width'), int, 'Largura da resolução deve ser um número inteiro'),
+    (('video', 'resolution', 'height'), int, 'Altura da resolução deve ser um número inteiro'),
+    (('video', 'fullscreen'), bool, 'Fullscreen deve ser um booleano'),
+    (('video', 'aspect_ratio'), _ASPECT_RATIOS, 'Proporção de tela inválida'),
+    (('video', 'filter'), _FILTERS, 'Filtro inválido'),
+    (('audio', 'enabled'), bool, 'Áudio habilitado deve ser um booleano'),
+    (('audio', 'volume'), (int, float), 'Volume deve ser um número entre 0 e 100'),
+    (('audio', 'sample_rate'), int, 'Taxa de amostragem deve ser um número inteiro'),
+    (('audio', 'resampling_quality'), _RESAMPLING_QUALITY, 'Qualidade de reamostragem inválida'),
+    (('input', 'deadzone'), (int, float), 'Zona morta deve ser um número'),
+    (('input', 'turbo_speed'), int, 'Velocidade do turbo deve ser um número inteiro'),
+    (('system', 'region'), _REGIONS, 'Região inválida'),
+    (('system', 'auto_save'), bool, 'Auto-save deve ser um booleano'),
+    (('system', 'auto_save_interval'), int, 'Intervalo de auto-save deve ser um número inteiro'),
+    (('ui', 'show_menu_bar'), bool, 'Exibir barra de menu deve ser um booleano'),
+    (('ui', 'notification_duration'), (int, float), 'Duração das notificações deve ser um número'),
+    (('debug', 'log_level'), _LOG_LEVELS, 'Nível de log inválido'),
+    (('debug', 'show_debug_info'), bool, 'Exibir informações de debug deve ser um booleano'),
+)
+
+def _make_check(expected):
+    """
+    Cria a função de verificação para uma entrada de _SCHEMA.
+
+    Args:
+        expected: Tipo (ou tupla de tipos) ou conjunto de valores permitidos.
+
+    Returns:
+        Função que recebe o valor e retorna True se ele for válido.
+    """
+    if isinstance(expected, (type, tuple)):
+        return lambda value: isinstance(value, expected)
+    return lambda value: value in expected
+
+# Validadores por (seção, chave) para alterações pontuais; chaves com subcampos
+# (como a resolução) ficam de fora e passam pela validação completa
+_KEY_VALIDATORS = {
+    path: (_make_check(expected), message)
+    for path, expected, message in _SCHEMA
+    if len(path) == 2 and not any(len(other) > 2 and other[:2] == path
+                                  for other, _, _ in _SCHEMA)
+}
+_KEY_VALIDATORS[('audio', 'volume')] = (
+    lambda value: isinstance(value, (int, float)) and 0 <= value <= 100,
+    'Volume deve ser um número entre 0 e 100'
+)
+
+def _default_settings() -> Dict:
+    """
+    Retorna uma cópia profunda e independente das configurações padrão.
+
+    Returns:
+        Dicionário com as configurações padrão.
+    """
+    return loads(_DEFAULT_BYTES)
+
 def create_settings_directory() -> bool:
     """
     Cria o diretório de configurações.
@@ -109,12 +187,45 @@ def load_settings() -> Dict:
     settings_path = get_settings_path()
     if os.path.exists(settings_path):
         try:
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(settings_path)
         except Exception as e:
             print(f'Erro ao carregar configurações: {e}', file=sys.stderr)
-            return DEFAULT_SETTINGS.copy()
-    return DEFAULT_SETTINGS.copy()
+            return _default_settings()
+    return _default_settings()
+
+@lru_cache(maxsize=4)
+def _load_settings_cached(settings_path: str, mtime_ns: int) -> Dict:
+    """
+    Lê o arquivo de configurações, memorizando o resultado por data de modificação.
+
+    Args:
+        settings_path: Caminho do arquivo de configurações.
+        mtime_ns: Data de modificação do arquivo, usada apenas como chave do cache.
+
+    Returns:
+        Dicionário com as configurações.
+    """
+    return read_json(settings_path)
+
+def _load_settings_readonly() -> Dict:
+    """
+    Carrega as configurações para consulta, sem reler o arquivo se ele não mudou.
+
+    O dicionário retornado é compartilhado e não deve ser alterado.
+
+    Returns:
+        Dicionário com as configurações.
+    """
+    settings_path = get_settings_path()
+    try:
+        mtime_ns = os.stat(settings_path).st_mtime_ns
+    except OSError:
+        return DEFAULT_SETTINGS
+    try:
+        return _load_settings_cached(settings_path, mtime_ns)
+    except Exception as e:
+        print(f'Erro ao carregar configurações: {e}', file=sys.stderr)
+        return DEFAULT_SETTINGS
 
 def save_settings(settings: Dict) -> bool:
     """
@@ -128,8 +239,11 @@ def save_settings(settings: Dict) -> bool:
     """
     try:
         settings_path = get_settings_path()
-        with open(settings_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        data = dump_json(settings)
+
+        # Grava num arquivo temporário e substitui o original de forma atômica
+        atomic_write_bytes(settings_path, data)
+        _load_settings_cached.cache_clear()
         return True
     except Exception as e:
         print(f'Erro ao salvar configurações: {e}', file=sys.stderr)
@@ -148,66 +262,22 @@ def validate_settings(settings: Dict) -> Tuple[bool, Optional[str]]:
     """
     try:
         # Verifica se todas as seções necessárias existem
-        required_sections = ['video', 'audio', 'input', 'system', 'ui', 'debug']
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in settings:
                 return False, f'Seção obrigatória ausente: {section}'
 
-        # Valida configurações de vídeo
-        video = settings['video']
-        if not isinstance(video['resolution'], dict):
-            return False, 'Resolução inválida'
-        if not isinstance(video['resolution']['width'], int):
-            return False, 'Largura da resolução deve ser um número inteiro'
-        if not isinstance(video['resolution']['height'], int):
-            return False, 'Altura da resolução deve ser um número inteiro'
-        if not isinstance(video['fullscreen'], bool):
-            return False, 'Fullscreen deve ser um booleano'
-        if video['aspect_ratio'] not in ['original', 'stretch', '4:3', '16:9']:
-            return False, 'Proporção de tela inválida'
-        if video['filter'] not in ['nearest', 'linear', 'bicubic']:
-            return False, 'Filtro inválido'
-
-        # Valida configurações de áudio
-        audio = settings['audio']
-        if not isinstance(audio['enabled'], bool):
-            return False, 'Áudio habilitado deve ser um booleano'
-        if not isinstance(audio['volume'], (int, float)) or audio['volume'] < 0 or audio['volume'] > 100:
+        # Valida cada campo conforme a tabela declarativa
+        for path, expected, message in _SCHEMA:
+            value = reduce(dict.__getitem__, path, settings)
+            if isinstance(expected, (type, tuple)):
+                if not isinstance(value, expected):
+                    return False, message
+            elif value not in expected:
+                return False, message
+
+        volume = settings['audio']['volume']
+        if volume < 0 or volume > 100:
             return False, 'Volume deve ser um número entre 0 e 100'
-        if not isinstance(audio['sample_rate'], int):
-            return False, 'Taxa de amostragem deve ser um número inteiro'
-        if audio['resampling_quality'] not in ['low', 'medium', 'high']:
-            return False, 'Qualidade de reamostragem inválida'
-
-        # Valida configurações de entrada
-        input_settings = settings['input']
-        if not isinstance(input_settings['deadzone'], (int, float)):
-            return False, 'Zona morta deve ser um número'
-        if not isinstance(input_settings['turbo_speed'], int):
-            return False, 'Velocidade do turbo deve ser um número inteiro'
-
-        # Valida configurações do sistema
-        system = settings['system']
-        if system['region'] not in ['auto', 'jp', 'us', 'eu']:
-            return False, 'Região inválida'
-        if not isinstance(system['auto_save'], bool):
-            return False, 'Auto-save deve ser um booleano'
-        if not isinstance(system['auto_save_interval'], int):
-            return False, 'Intervalo de auto-save deve ser um número inteiro'
-
-        # Valida configurações da interface
-        ui = settings['ui']
-        if not isinstance(ui['show_menu_bar'], bool):
-            return False, 'Exibir barra de menu deve ser um booleano'
-        if not isinstance(ui['notification_duration'], (int, float)):
-            return False, 'Duração das notificações deve ser um número'
-
-        # Valida configurações de debug
-        debug = settings['debug']
-        if debug['log_level'] not in ['debug', 'info', 'warning', 'error']:
-            return False, 'Nível de log inválido'
-        if not isinstance(debug['show_debug_info'], bool):
-            return False, 'Exibir informações de debug deve ser um booleano'
 
         return True, None
     except Exception as e:
@@ -222,13 +292,18 @@ def get_setting(section: str, key: str) -> Optional[Union[str, int, float, bool,
         key: Chave da configuração.
 
     Returns:
-        Valor da configuração ou None se não encontrada.
+        Valor da configuração ou None se não encontrada. Dicionários e listas
+        são cópias independentes, que o chamador pode alterar livremente.
     """
     try:
-        settings = load_settings()
-        return settings[section][key]
+        settings = _load_settings_readonly()
+        value = settings[section][key]
     except Exception:
         return None
+    # O dicionário lido é compartilhado com o cache e com DEFAULT_SETTINGS
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
 
 def set_setting(section: str, key: str, value: Union[str, int, float, bool, Dict, List]) -> bool:
     """
@@ -242,15 +317,44 @@ def set_setting(section: str, key: str, value: Union[str, int, float, bool, Dict
     Returns:
         True se a configuração foi definida com sucesso, False caso contrário.
     """
+    return set_settings_bulk([(section, key, value)])
+
+def set_settings_bulk(pairs: List[Tuple[str, str, Union[str, int, float, bool, Dict, List]]]) -> bool:
+    """
+    Define várias configurações com uma única leitura, validação e gravação.
+
+    Args:
+        pairs: Lista de tuplas (seção, chave, valor).
+
+    Returns:
+        True se as configurações foram definidas com sucesso, False caso contrário.
+    """
     try:
+        # Chaves conhecidas são validadas individualmente; as demais exigem
+        # a validação completa
+        full_check = False
+        for section, key, value in pairs:
+            validator = _KEY_VALIDATORS.get((section, key))
+            if validator is None:
+                full_check = True
+                continue
+            check, message = validator
+            try:
+                valid = check(value)
+            except TypeError:
+                valid = False
+            if not valid:
+                print(f'Configuração inválida: {message}', file=sys.stderr)
+                return False
+
         settings = load_settings()
-        if section not in settings:
-            settings[section] = {}
-        settings[section][key] = value
-        valid, message = validate_settings(settings)
-        if not valid:
-            print(f'Configuração inválida: {message}', file=sys.stderr)
-            return False
+        for section, key, value in pairs:
+            settings.setdefault(section, {})[key] = value
+        if full_check:
+            valid, message = validate_settings(settings)
+            if not valid:
+                print(f'Configuração inválida: {message}', file=sys.stderr)
+                return False
         return save_settings(settings)
     except Exception as e:
         print(f'Erro ao definir configuração: {e}', file=sys.stderr)
@@ -263,7 +367,7 @@ def reset_settings() -> bool:
     Returns:
         True se as configurações foram restauradas com sucesso, False caso contrário.
     """
-    return save_settings(DEFAULT_SETTINGS.copy())
+    return save_settings(_default_settings())
 
 def export_settings(output_path: str) -> bool:
     """
@@ -278,8 +382,7 @@ def export_settings(output_path: str) -> bool:
     try:
         settings = load_settings()
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(dump_json(settings))
         return True
     except Exception as e:
         print(f'Erro ao exportar configurações: {e}', file=sys.stderr)
@@ -300,8 +403,7 @@ def import_settings(input_path: str) -> bool:
             print(f'Arquivo não encontrado: {input_path}', file=sys.stderr)
             return False
 
-        with open(input_path, 'r', encoding='utf-8') as f:
-            settings = json.load(f)
+        settings = read_json(input_path)
 
         valid, message = validate_settings(settings)
         if not valid:
@@ -313,20 +415,187 @@ def import_settings(input_path: str) -> bool:
         print(f'Erro ao importar configurações: {e}', file=sys.stderr)
         return False
 
-def print_settings(settings: Dict, indent: int = 0) -> None:
+def print_settings(settings: Dict, indent: int = 0,
+                   _buf: Optional[io.StringIO] = None) -> None:
     """
     Imprime as configurações de forma hierárquica.
 
+    A saída é montada em memória e escrita de uma só vez no final.
+
     Args:
         settings: Dicionário com as configurações.
         indent: Nível de indentação.
     """
+    buf = io.StringIO() if _buf is None else _buf
+    prefix = '  ' * indent
     for key, value in settings.items():
         if isinstance(value, dict):
-            print('  ' * indent + f'{key}:')
-            print_settings(value, indent + 1)
+            buf.write(f'{prefix}{key}:\n')
+            print_settings(value, indent + 1, buf)
         else:
-            print('  ' * indent + f'{key}: {value}')
+            buf.write(f'{prefix}{key}: {value}\n')
+    if _buf is None:
+        sys.stdout.write(buf.getvalue())
+
+def _coerce_value(value: str) -> Union[str, int, float, bool, Dict, List]:
+    """
+    Converte um valor da linha de comando para o tipo apropriado.
+
+    Args:
+        value: Valor em texto.
+
+    Returns:
+        Booleano, inteiro, número real, objeto/array JSON ou o próprio texto.
+    """
+    lowered = value.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+        if math.isfinite(number):
+            return number
+    except ValueError:
+        pass
+    if value[:1] in ('{', '['):
+        return json.loads(value)
+    return value
+
+def _cmd_init(args: List[str]) -> int:
+    """
+    Comando init: cria o diretório de configurações.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if create_settings_directory() else 1
+
+def _cmd_get(args: List[str]) -> int:
+    """
+    Comando get: exibe o valor de uma configuração.
+
+    Args:
+        args: [seção, chave].
+
+    Returns:
+        0 se a configuração existe, 1 caso contrário.
+    """
+    value = get_setting(args[0], args[1])
+    if value is not None:
+        print(value)
+        return 0
+    return 1
+
+def _cmd_set(args: List[str]) -> int:
+    """
+    Comando set: altera uma ou várias configurações.
+
+    Args:
+        args: [seção, chave, valor] ou atribuições <seção>.<chave>=<valor>.
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    try:
+        # Forma em lote: set <seção>.<chave>=<valor> [...]
+        if '=' in args[0]:
+            pairs = []
+            for arg in args:
+                name, sep, raw = arg.partition('=')
+                section, dot, key = name.partition('.')
+                if not sep or not dot or not section or not key:
+                    print(f'Atribuição inválida: {arg}', file=sys.stderr)
+                    return 1
+                # Subcampos (como video.resolution.width) não são aceitos
+                # nesta forma; o valor da chave inteira é passado em JSON
+                if '.' in key:
+                    print(f'Subcampos não são suportados: {name}. '
+                          f'Use set {section} {key.partition(".")[0]} <valor JSON>',
+                          file=sys.stderr)
+                    return 1
+                if key not in DEFAULT_SETTINGS.get(section, {}):
+                    print(f'Configuração desconhecida: {name}', file=sys.stderr)
+                    return 1
+                pairs.append((section, key, _coerce_value(raw)))
+            return 0 if set_settings_bulk(pairs) else 1
+
+        if len(args) < 3:
+            print('Comando inválido ou argumentos insuficientes.', file=sys.stderr)
+            return 1
+        value = _coerce_value(args[2])
+        return 0 if set_setting(args[0], args[1], value) else 1
+    except json.JSONDecodeError:
+        print('Formato inválido para o valor. Use JSON para objetos e arrays.',
+              file=sys.stderr)
+        return 1
+
+def _cmd_list(args: List[str]) -> int:
+    """
+    Comando list: exibe todas as configurações.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        Sempre 0.
+    """
+    print_settings(_load_settings_readonly())
+    return 0
+
+def _cmd_reset(args: List[str]) -> int:
+    """
+    Comando reset: restaura as configurações padrão.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if reset_settings() else 1
+
+def _cmd_export(args: List[str]) -> int:
+    """
+    Comando export: exporta as configurações para um arquivo.
+
+    Args:
+        args: [caminho do arquivo de destino].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if export_settings(args[0]) else 1
+
+def _cmd_import(args: List[str]) -> int:
+    """
+    Comando import: importa as configurações de um arquivo.
+
+    Args:
+        args: [caminho do arquivo de origem].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if import_settings(args[0]) else 1
+
+# Tabela de comandos: nome -> (função, número mínimo de argumentos)
+_COMMANDS = {
+    'init': (_cmd_init, 0),
+    'get': (_cmd_get, 2),
+    'set': (_cmd_set, 1),
+    'list': (_cmd_list, 0),
+    'reset': (_cmd_reset, 0),
+    'export': (_cmd_export, 1),
+    'import': (_cmd_import, 1),
+}
 
 def main() -> int:
     """
@@ -340,61 +609,22 @@ def main() -> int:
         print('\nComandos disponíveis:', file=sys.stderr)
         print('  init                  Cria diretório de configurações', file=sys.stderr)
         print('  get <seção> <chave>   Obtém valor de uma configuração', file=sys.stderr)
-        print('  set <seção> <chave> <valor>')
+        print('  set <seção> <chave> <valor>', file=sys.stderr)
         print('                        Define valor de uma configuração', file=sys.stderr)
+        print('  set <seção>.<chave>=<valor> [...]', file=sys.stderr)
+        print('                        Define várias configurações de uma vez', file=sys.stderr)
         print('  list                  Lista todas as configurações', file=sys.stderr)
         print('  reset                 Restaura configurações padrão', file=sys.stderr)
         print('  export <arquivo>      Exporta configurações', file=sys.stderr)
         print('  import <arquivo>      Importa configurações', file=sys.stderr)
         return 1
 
-    command = sys.argv[1]
-
-    if command == 'init':
-        return 0 if create_settings_directory() else 1
-
-    elif command == 'get' and len(sys.argv) > 3:
-        value = get_setting(sys.argv[2], sys.argv[3])
-        if value is not None:
-            print(value)
-            return 0
-        return 1
-
-    elif command == 'set' and len(sys.argv) > 4:
-        try:
-            # Tenta converter o valor para o tipo apropriado
-            value = sys.argv[4]
-            if value.lower() == 'true':
-                value = True
-            elif value.lower() == 'false':
-                value = False
-            elif value.replace('.', '').isdigit():
-                value = int(value) if value.isdigit() else float(value)
-            elif value.startswith('{') or value.startswith('['):
-                value = json.loads(value)
-            return 0 if set_setting(sys.argv[2], sys.argv[3], value) else 1
-        except json.JSONDecodeError:
-            print('Formato inválido para o valor. Use JSON para objetos e arrays.',
-                  file=sys.stderr)
-            return 1
-
-    elif command == 'list':
-        settings = load_settings()
-        print_settings(settings)
-        return 0
-
-    elif command == 'reset':
-        return 0 if reset_settings() else 1
-
-    elif command == 'export' and len(sys.argv) > 2:
-        return 0 if export_settings(sys.argv[2]) else 1
-
-    elif command == 'import' and len(sys.argv) > 2:
-        return 0 if import_settings(sys.argv[2]) else 1
-
-    else:
+    handler, min_args = _COMMANDS.get(sys.argv[1], (None, 0))
+    if handler is None or len(sys.argv) < 2 + min_args:
         print('Comando inválido ou argumentos insuficientes.', file=sys.stderr)
         return 1
 
+    return handler(sys.argv[2:])
+
 if __name__ == '__main__':
     sys.exit(main())
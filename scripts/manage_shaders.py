@@ -9,10 +9,13 @@ import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from manage_common import dump_json, read_json
+
 # Tipos de shaders suportados
 SHADER_TYPES = {
     'vertex': ['.vert', '.vs'],
@@ -21,6 +24,10 @@ SHADER_TYPES = {
     'geometry': ['.geom', '.gs']
 }
 
+# Mapeamento extensão -> tipo de shader, pré-calculado para consultas diretas
+_EXT_TO_TYPE = {ext: shader_type for shader_type, extensions in SHADER_TYPES.items()
+                for ext in extensions}
+
 # Presets de shaders
 DEFAULT_PRESETS = {
     'crt': {
@@ -79,13 +86,16 @@ def create_shader_directories() -> bool:
         True se os diretórios foram criados com sucesso, False caso contrário.
     """
     try:
-        # Cria diretórios principais
-        dirs = ['shaders', 'shaders/presets', 'shaders/cache']
-        for shader_type in SHADER_TYPES:
-            dirs.append(f'shaders/{shader_type}')
+        # Cria diretórios principais; ordenados por profundidade, cada pai já
+        # existe quando o filho é criado e basta um mkdir por diretório
+        dirs = ['shaders', 'shaders/presets', 'shaders/cache',
+                *(f'shaders/{shader_type}' for shader_type in SHADER_TYPES)]
 
-        for directory in dirs:
-            os.makedirs(directory, exist_ok=True)
+        for directory in sorted(set(dirs), key=lambda d: d.count('/')):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
 
         return True
     except Exception as e:
@@ -103,17 +113,12 @@ def validate_shader(shader_path: str) -> Tuple[bool, Optional[str]]:
         Uma tupla (válido, tipo) onde válido é um booleano e tipo é o tipo do shader
         ou None se inválido.
     """
-    # Verifica se o arquivo existe
-    if not os.path.exists(shader_path):
+    # Verifica a extensão e se o arquivo existe
+    shader_type = _EXT_TO_TYPE.get(os.path.splitext(shader_path)[1].lower())
+    if shader_type is None or not os.path.exists(shader_path):
         return False, None
 
-    # Verifica a extensão
-    ext = os.path.splitext(shader_path)[1].lower()
-    for shader_type, extensions in SHADER_TYPES.items():
-        if ext in extensions:
-            return True, shader_type
-
-    return False, None
+    return True, shader_type
 
 def install_shader(shader_path: str) -> bool:
     """
@@ -147,8 +152,75 @@ def install_shader(shader_path: str) -> bool:
         print(f'Erro ao instalar shader: {e}', file=sys.stderr)
         return False
 
+def _snapshot_installed_shaders() -> Dict[str, str]:
+    """
+    Levanta os shaders instalados com uma única passada de os.walk.
+
+    Returns:
+        Dicionário {nome do shader: tipo}.
+    """
+    inventory = {}
+    for dirpath, dirnames, filenames in os.walk('shaders'):
+        if dirpath == 'shaders':
+            # Desce apenas nos diretórios de tipos de shader
+            dirnames[:] = [d for d in dirnames if d in SHADER_TYPES]
+            continue
+        dirnames.clear()
+        shader_type = os.path.basename(dirpath)
+        for name in filenames:
+            inventory[name] = shader_type
+    return inventory
+
+def _find_missing_shader(shaders: List[str],
+                         inventory: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Procura o primeiro shader da lista que não está instalado.
+
+    Args:
+        shaders: Lista de shaders.
+        inventory: Shaders instalados obtidos por _snapshot_installed_shaders();
+            se omitido, cada shader é verificado individualmente.
+
+    Returns:
+        Nome do shader ausente ou None se todos existem.
+    """
+    for shader in shaders:
+        if inventory is not None:
+            found = shader in inventory
+        else:
+            shader_type = _EXT_TO_TYPE.get(os.path.splitext(shader)[1].lower())
+            found = (shader_type is not None and
+                     os.path.exists(f'shaders/{shader_type}/{shader}'))
+        if not found:
+            return shader
+    return None
+
+def _build_preset(name: str, description: str, shaders: List[str],
+                  parameters: Dict, created: str) -> Tuple[str, bytes]:
+    """
+    Monta o caminho e o conteúdo serializado de um preset.
+
+    Args:
+        name: Nome do preset.
+        description: Descrição do preset.
+        shaders: Lista de shaders utilizados.
+        parameters: Parâmetros do preset.
+        created: Data de criação em formato ISO.
+
+    Returns:
+        Uma tupla (caminho, conteúdo) do arquivo do preset.
+    """
+    preset = {
+        'name': name,
+        'description': description,
+        'shaders': shaders,
+        'parameters': parameters,
+        'created': created
+    }
+    return f'shaders/presets/{name.lower()}.json', dump_json(preset)
+
 def create_preset(name: str, description: str, shaders: List[str],
-                 parameters: Dict) -> bool:
+                 parameters: Dict, inventory: Optional[Dict[str, str]] = None) -> bool:
     """
     Cria um preset de shader.
 
@@ -157,36 +229,23 @@ def create_preset(name: str, description: str, shaders: List[str],
         description: Descrição do preset.
         shaders: Lista de shaders utilizados.
         parameters: Parâmetros do preset.
+        inventory: Shaders instalados obtidos por _snapshot_installed_shaders();
+            se omitido, cada shader é verificado individualmente.
 
     Returns:
         True se o preset foi criado com sucesso, False caso contrário.
     """
     try:
         # Verifica se todos os shaders existem
-        for shader in shaders:
-            shader_path = None
-            for shader_type in SHADER_TYPES:
-                test_path = f'shaders/{shader_type}/{shader}'
-                if os.path.exists(test_path):
-                    shader_path = test_path
-                    break
-            if not shader_path:
-                print(f'Shader não encontrado: {shader}', file=sys.stderr)
-                return False
-
-        # Cria o preset
-        preset = {
-            'name': name,
-            'description': description,
-            'shaders': shaders,
-            'parameters': parameters,
-            'created': datetime.now().isoformat()
-        }
+        missing = _find_missing_shader(shaders, inventory)
+        if missing is not None:
+            print(f'Shader não encontrado: {missing}', file=sys.stderr)
+            return False
 
-        # Salva o preset
-        preset_path = f'shaders/presets/{name.lower()}.json'
-        with open(preset_path, 'w', encoding='utf-8') as f:
-            json.dump(preset, f, indent=2, ensure_ascii=False)
+        # Cria e salva o preset
+        preset_path, data = _build_preset(name, description, shaders, parameters,
+                                          datetime.now().isoformat())
+        Path(preset_path).write_bytes(data)
 
         print(f'Preset criado: {name}')
         return True
@@ -202,13 +261,27 @@ def install_default_presets() -> bool:
         True se os presets foram instalados com sucesso, False caso contrário.
     """
     try:
-        for preset_id, preset_data in DEFAULT_PRESETS.items():
-            create_preset(
+        # Verifica os shaders com uma única varredura e monta todos os presets
+        inventory = _snapshot_installed_shaders()
+        created = datetime.now().isoformat()
+        payloads = []
+        for preset_data in DEFAULT_PRESETS.values():
+            missing = _find_missing_shader(preset_data['shaders'], inventory)
+            if missing is not None:
+                print(f'Shader não encontrado: {missing}', file=sys.stderr)
+                continue
+            payloads.append((preset_data['name'], *_build_preset(
                 preset_data['name'],
                 preset_data['description'],
                 preset_data['shaders'],
-                preset_data['parameters']
-            )
+                preset_data['parameters'],
+                created
+            )))
+
+        # Grava os arquivos já serializados
+        for name, preset_path, data in payloads:
+            Path(preset_path).write_bytes(data)
+            print(f'Preset criado: {name}')
         return True
     except Exception as e:
         print(f'Erro ao instalar presets padrão: {e}', file=sys.stderr)
@@ -224,14 +297,15 @@ def list_shaders() -> bool:
     try:
         print('\nShaders instalados:')
         for shader_type in SHADER_TYPES:
-            shader_dir = f'shaders/{shader_type}'
-            if os.path.exists(shader_dir):
-                shaders = [f for f in os.listdir(shader_dir)
-                          if os.path.isfile(os.path.join(shader_dir, f))]
-                if shaders:
-                    print(f'\n{shader_type.capitalize()}:')
-                    for shader in sorted(shaders):
-                        print(f'  - {shader}')
+            try:
+                with os.scandir(f'shaders/{shader_type}') as entries:
+                    shaders = sorted(entry.name for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                continue
+            if shaders:
+                print(f'\n{shader_type.capitalize()}:')
+                for shader in shaders:
+                    print(f'  - {shader}')
         return True
     except Exception as e:
         print(f'Erro ao listar shaders: {e}', file=sys.stderr)
@@ -250,18 +324,22 @@ def list_presets() -> bool:
             print('Nenhum preset encontrado.')
             return True
 
+        preset_paths = [os.path.join(presets_dir, preset_file)
+                        for preset_file in sorted(os.listdir(presets_dir))
+                        if preset_file.endswith('.json')]
+
+        # Lê os arquivos em paralelo; executor.map preserva a ordem
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            presets = list(executor.map(read_json, preset_paths))
+
         print('\nPresets disponíveis:')
-        for preset_file in sorted(os.listdir(presets_dir)):
-            if preset_file.endswith('.json'):
-                preset_path = os.path.join(presets_dir, preset_file)
-                with open(preset_path, 'r', encoding='utf-8') as f:
-                    preset = json.load(f)
-                print(f'\n{preset["name"]}:')
-                print(f'  Descrição: {preset["description"]}')
-                print(f'  Shaders: {", ".join(preset["shaders"])}')
-                print('  Parâmetros:')
-                for param, value in preset['parameters'].items():
-                    print(f'    - {param}: {value}')
+        for preset in presets:
+            print(f'\n{preset["name"]}:')
+            print(f'  Descrição: {preset["description"]}')
+            print(f'  Shaders: {", ".join(preset["shaders"])}')
+            print('  Parâmetros:')
+            for param, value in preset['parameters'].items():
+                print(f'    - {param}: {value}')
         return True
     except Exception as e:
         print(f'Erro ao listar presets: {e}', file=sys.stderr)
@@ -278,13 +356,15 @@ def remove_shader(shader_name: str) -> bool:
         True se o shader foi removido com sucesso, False caso contrário.
     """
     try:
-        # Procura o shader em todos os diretórios
-        for shader_type in SHADER_TYPES:
-            shader_path = f'shaders/{shader_type}/{shader_name}'
-            if os.path.exists(shader_path):
-                os.remove(shader_path)
+        # A extensão determina o único diretório onde o shader pode estar
+        shader_type = _EXT_TO_TYPE.get(os.path.splitext(shader_name)[1].lower())
+        if shader_type is not None:
+            try:
+                os.remove(f'shaders/{shader_type}/{shader_name}')
                 print(f'Shader removido: {shader_name}')
                 return True
+            except FileNotFoundError:
+                pass
 
         print(f'Shader não encontrado: {shader_name}', file=sys.stderr)
         return False
@@ -315,6 +395,123 @@ def remove_preset(preset_name: str) -> bool:
         print(f'Erro ao remover preset: {e}', file=sys.stderr)
         return False
 
+def _cmd_init(args: List[str]) -> int:
+    """
+    Comando init: cria os diretórios de shaders.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if create_shader_directories() else 1
+
+def _cmd_install(args: List[str]) -> int:
+    """
+    Comando install: instala um shader.
+
+    Args:
+        args: [caminho do shader].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if install_shader(args[0]) else 1
+
+def _cmd_create_preset(args: List[str]) -> int:
+    """
+    Comando create-preset: cria um preset de shaders.
+
+    Args:
+        args: [nome, descrição, shaders (JSON), parâmetros (JSON)].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    try:
+        name = args[0]
+        description = args[1]
+        shaders = json.loads(args[2])
+        parameters = json.loads(args[3])
+        return 0 if create_preset(name, description, shaders, parameters) else 1
+    except json.JSONDecodeError:
+        print('Formato inválido para shaders ou parâmetros. Use JSON.',
+              file=sys.stderr)
+        return 1
+
+def _cmd_install_defaults(args: List[str]) -> int:
+    """
+    Comando install-defaults: instala os presets padrão.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if install_default_presets() else 1
+
+def _cmd_list(args: List[str]) -> int:
+    """
+    Comando list: lista os shaders instalados.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if list_shaders() else 1
+
+def _cmd_list_presets(args: List[str]) -> int:
+    """
+    Comando list-presets: lista os presets instalados.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if list_presets() else 1
+
+def _cmd_remove(args: List[str]) -> int:
+    """
+    Comando remove: remove um shader.
+
+    Args:
+        args: [nome do shader].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if remove_shader(args[0]) else 1
+
+def _cmd_remove_preset(args: List[str]) -> int:
+    """
+    Comando remove-preset: remove um preset.
+
+    Args:
+        args: [nome do preset].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if remove_preset(args[0]) else 1
+
+# Tabela de comandos: nome -> (função, número mínimo de argumentos)
+_COMMANDS = {
+    'init': (_cmd_init, 0),
+    'install': (_cmd_install, 1),
+    'create-preset': (_cmd_create_preset, 4),
+    'install-defaults': (_cmd_install_defaults, 0),
+    'list': (_cmd_list, 0),
+    'list-presets': (_cmd_list_presets, 0),
+    'remove': (_cmd_remove, 1),
+    'remove-preset': (_cmd_remove_preset, 1),
+}
+
 def main() -> int:
     """
     Função principal.
@@ -336,44 +533,12 @@ def main() -> int:
         print('  remove-preset <nome>  Remove um preset', file=sys.stderr)
         return 1
 
-    command = sys.argv[1]
-
-    if command == 'init':
-        return 0 if create_shader_directories() else 1
-
-    elif command == 'install' and len(sys.argv) > 2:
-        return 0 if install_shader(sys.argv[2]) else 1
-
-    elif command == 'create-preset' and len(sys.argv) > 5:
-        try:
-            name = sys.argv[2]
-            description = sys.argv[3]
-            shaders = json.loads(sys.argv[4])
-            parameters = json.loads(sys.argv[5])
-            return 0 if create_preset(name, description, shaders, parameters) else 1
-        except json.JSONDecodeError:
-            print('Formato inválido para shaders ou parâmetros. Use JSON.',
-                  file=sys.stderr)
-            return 1
-
-    elif command == 'install-defaults':
-        return 0 if install_default_presets() else 1
-
-    elif command == 'list':
-        return 0 if list_shaders() else 1
-
-    elif command == 'list-presets':
-        return 0 if list_presets() else 1
-
-    elif command == 'remove' and len(sys.argv) > 2:
-        return 0 if remove_shader(sys.argv[2]) else 1
-
-    elif command == 'remove-preset' and len(sys.argv) > 2:
-        return 0 if remove_preset(sys.argv[2]) else 1
-
-    else:
+    handler, min_args = _COMMANDS.get(sys.argv[1], (None, 0))
+    if handler is None or len(sys.argv) < 2 + min_args:
         print('Comando inválido ou argumentos insuficientes.', file=sys.stderr)
         return 1
 
+    return handler(sys.argv[2:])
+
 if __name__ == '__main__':
     sys.exit(main())
@@ -5,19 +5,29 @@
 Script para gerenciar os recursos de teste do emulador.
 """
 
+import atexit
 import os
 import sys
-import json
+import importlib.util
+from html import escape
 import shutil
+import stat
+import string
 import logging
 import logging.handlers
+import queue
 import subprocess
-import unittest
-import coverage
-import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from manage_common import dump_json, read_json
+
+# coverage, pytest e unittest só são importados quando os testes são executados
+if TYPE_CHECKING:
+    import unittest
 
 # Configurações de teste
 TEST_CONFIG = {
@@ -48,7 +58,8 @@ TEST_CONFIG = {
             'pattern': 'test_*.py',
             'directory': 'test/system',
             'timeout': 600,
-            'parallel': False
+            'parallel': False,
+            'coverage': False
         }
     },
     'fixtures': {
@@ -78,6 +89,7 @@ TEST_CONFIG = {
     },
     'coverage': {
         'enabled': True,
+        'engine': 'coverage',  # coverage, slipcover
         'branch': True,
         'source': ['src'],
         'omit': [
@@ -120,23 +132,83 @@ def create_directories() -> bool:
         True se os diretórios foram criados com sucesso, False caso contrário.
     """
     try:
-        # Cria diretórios principais
-        for directory in TEST_CONFIG['directories'].values():
-            os.makedirs(directory, exist_ok=True)
-
-        # Cria diretórios de suites
-        for suite in TEST_CONFIG['suites'].values():
-            os.makedirs(suite['directory'], exist_ok=True)
-
-        # Cria diretórios de fixtures
-        for fixture in TEST_CONFIG['fixtures'].values():
-            os.makedirs(fixture['directory'], exist_ok=True)
+        # Diretórios principais, de suites e de fixtures
+        targets = {os.path.normpath(directory) for directory in (
+            *TEST_CONFIG['directories'].values(),
+            *(suite['directory'] for suite in TEST_CONFIG['suites'].values()),
+            *(fixture['directory'] for fixture in TEST_CONFIG['fixtures'].values())
+        )}
+
+        # Diretórios que são ancestrais de outro alvo são criados junto com ele
+        leaves = [directory for directory in targets
+                  if not any(other.startswith(directory + os.sep) for other in targets)]
+
+        for directory in sorted(leaves):
+            path = Path(directory)
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
 
         return True
     except Exception as e:
         print(f'Erro ao criar diretórios: {e}', file=sys.stderr)
         return False
 
+def _fixture_template(name: str, header: bytes, size: int,
+                      read_only: bool = False) -> str:
+    """
+    Retorna o caminho de um arquivo modelo para fixtures, criando-o na primeira vez.
+
+    Args:
+        name: Nome do arquivo modelo.
+        header: Cabeçalho gravado antes dos dados aleatórios.
+        size: Quantidade de bytes aleatórios.
+        read_only: Se True, o modelo fica somente leitura; necessário quando
+            as fixtures são hard links para ele.
+
+    Returns:
+        Caminho do arquivo modelo.
+    """
+    cache_dir = os.path.join(TEST_CONFIG['directories']['fixtures'], '.cache')
+    template_path = os.path.join(cache_dir, name)
+    if not os.path.exists(template_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        Path(template_path).write_bytes(header + os.urandom(size))
+    if read_only:
+        os.chmod(template_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    return template_path
+
+def _link_fixture(template_path: str, fixture_path: str) -> None:
+    """
+    Cria uma fixture a partir do modelo, por hard link ou, se indisponível, cópia.
+
+    Todas as fixtures ligadas compartilham o conteúdo do modelo, que por isso
+    deve ser somente leitura; use apenas para fixtures imutáveis (ROMs).
+
+    Args:
+        template_path: Caminho do arquivo modelo.
+        fixture_path: Caminho da fixture.
+    """
+    try:
+        os.link(template_path, fixture_path)
+    except OSError:
+        shutil.copyfile(template_path, fixture_path)
+
+def _existing_files(directory: str) -> set:
+    """
+    Lista os nomes presentes em um diretório com uma única leitura.
+
+    Args:
+        directory: Caminho do diretório.
+
+    Returns:
+        Conjunto com os nomes das entradas; vazio se o diretório não existir.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
 def setup_fixtures() -> bool:
     """
     Configura fixtures de teste.
@@ -147,52 +219,169 @@ def setup_fixtures() -> bool:
     try:
         print('\nConfigurando fixtures...')
 
-        # ROMs de teste
+        # ROMs de teste: cabeçalho ROM + dados de teste; são imutáveis e
+        # compartilham o modelo somente leitura por hard link
         rom_dir = TEST_CONFIG['fixtures']['roms']['directory']
+        rom_template = None
+        existing = _existing_files(rom_dir)
         for rom in TEST_CONFIG['fixtures']['roms']['files']:
             rom_path = os.path.join(rom_dir, rom)
-            if not os.path.exists(rom_path):
-                # Cria ROM de teste
-                with open(rom_path, 'wb') as f:
-                    # Cabeçalho ROM
-                    f.write(b'SEGA MEGA DRIVE')
-                    # Dados de teste
-                    f.write(os.urandom(16384))
-
-        # Saves de teste
+            if rom not in existing:
+                if rom_template is None:
+                    rom_template = _fixture_template('template_16k.bin',
+                                                     b'SEGA MEGA DRIVE', 16384,
+                                                     read_only=True)
+                _link_fixture(rom_template, rom_path)
+
+        # Saves de teste; os testes gravam neles, então cada um é uma cópia
         save_dir = TEST_CONFIG['fixtures']['saves']['directory']
+        save_template = None
+        existing = _existing_files(save_dir)
         for save in TEST_CONFIG['fixtures']['saves']['files']:
             save_path = os.path.join(save_dir, save)
-            if not os.path.exists(save_path):
-                # Cria save de teste
-                with open(save_path, 'wb') as f:
-                    # Dados de teste
-                    f.write(os.urandom(8192))
+            if save not in existing:
+                if save_template is None:
+                    save_template = _fixture_template('template_8k.bin', b'', 8192)
+                shutil.copyfile(save_template, save_path)
 
         # Configs de teste
         config_dir = TEST_CONFIG['fixtures']['configs']['directory']
+        existing = _existing_files(config_dir)
         for config in TEST_CONFIG['fixtures']['configs']['files']:
             config_path = os.path.join(config_dir, config)
-            if not os.path.exists(config_path):
+            if config not in existing:
                 # Cria config de teste
                 if config.endswith('.json'):
-                    with open(config_path, 'w') as f:
-                        json.dump({
-                            'test': True,
-                            'timestamp': datetime.now().isoformat()
-                        }, f, indent=2)
+                    Path(config_path).write_bytes(dump_json({
+                        'test': True,
+                        'timestamp': datetime.now().isoformat()
+                    }))
 
         return True
     except Exception as e:
         print(f'Erro ao configurar fixtures: {e}', file=sys.stderr)
         return False
 
-def run_tests(suite: str) -> Optional[unittest.TestResult]:
+def _result_from_junit(junit_path: str) -> 'unittest.TestResult':
+    """
+    Converte um relatório JUnit XML em um resultado compatível com unittest.
+
+    Args:
+        junit_path: Caminho do relatório JUnit XML.
+
+    Returns:
+        Resultado dos testes.
+    """
+    import unittest
+
+    result = unittest.TestResult()
+    root = ET.parse(junit_path).getroot()
+    for case in root.iter('testcase'):
+        result.testsRun += 1
+        name = f'{case.get("classname")}.{case.get("name")}'
+        for child in case:
+            if child.tag == 'error':
+                result.errors.append((name, child.text or child.get('message', '')))
+            elif child.tag == 'failure':
+                result.failures.append((name, child.text or child.get('message', '')))
+            elif child.tag == 'skipped':
+                result.skipped.append((name, child.get('message', '')))
+    return result
+
+def _pytest_args(suite: str, config: Dict) -> Tuple[List[str], str]:
+    """
+    Monta os argumentos do pytest para uma suite.
+
+    Args:
+        suite: Nome da suite de testes.
+        config: Configuração da suite.
+
+    Returns:
+        Uma tupla (argumentos, caminho do relatório JUnit XML).
+    """
+    junit_path = os.path.join(TEST_CONFIG['directories']['reports'], f'junit_{suite}.xml')
+    args = [config['directory'],
+            '-p', 'no:cacheprovider',
+            '--rootdir', config['directory'],
+            '-o', f'python_files={config["pattern"]}',
+            f'--junitxml={junit_path}']
+    return args, junit_path
+
+def _run_tests_slipcover(suite: str, config: Dict) -> Optional['unittest.TestResult']:
+    """
+    Executa uma suite com pytest sob o SlipCover, em um subprocesso.
+
+    O SlipCover grava um único relatório por execução; aqui é o JSON, gravado
+    no diretório de cobertura e usado para verificar a cobertura mínima.
+    Relatórios de execuções anteriores são apagados antes, para que uma falha
+    ao iniciar o SlipCover não seja confundida com o resultado atual.
+
+    Args:
+        suite: Nome da suite de testes.
+        config: Configuração da suite.
+
+    Returns:
+        Resultado dos testes ou None em caso de erro.
+    """
+    coverage_config = TEST_CONFIG['coverage']
+    json_path = os.path.join(TEST_CONFIG['directories']['coverage'], f'{suite}.json')
+    pytest_args, junit_path = _pytest_args(suite, config)
+
+    cmd = [sys.executable, '-m', 'slipcover', '--json', '--out', json_path,
+           '--source', ','.join(coverage_config['source'])]
+    if coverage_config['branch']:
+        cmd.append('--branch')
+    if coverage_config['omit']:
+        cmd.extend(['--omit', ','.join(coverage_config['omit'])])
+    cmd.extend(['-m', 'pytest', *pytest_args])
+
+    for path in (junit_path, json_path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    # pytest retorna 1 quando há falhas e 5 quando nenhum teste é coletado;
+    # o SlipCover também retorna 1 se não iniciar, o que só se distingue
+    # pela falta dos relatórios
+    process = subprocess.run(cmd)
+    if process.returncode not in (0, 1, 5):
+        print(f'Erro ao executar pytest (código {process.returncode})', file=sys.stderr)
+        return None
+    missing = [path for path in (junit_path, json_path) if not os.path.exists(path)]
+    if missing:
+        print(f'Erro ao executar pytest com SlipCover (código {process.returncode}): '
+              f'relatório não gerado: {", ".join(missing)}', file=sys.stderr)
+        return None
+
+    result = _result_from_junit(junit_path)
+
+    # Verifica cobertura mínima
+    percent = read_json(json_path)['summary']['percent_covered']
+    print(f'\nCobertura: {percent:.2f}%')
+    if percent < coverage_config['report']['fail_under']:
+        print('\nCobertura abaixo do mínimo exigido.', file=sys.stderr)
+        return None
+
+    return result
+
+def _xdist_budget() -> int:
+    """
+    Retorna quantos processos do pytest-xdist podem rodar ao mesmo tempo.
+
+    Returns:
+        Número de núcleos menos dois, reservados ao sistema (mínimo 1).
+    """
+    return max((os.cpu_count() or 1) - 2, 1)
+
+def run_tests(suite: str, workers: Optional[int] = None) -> Optional['unittest.TestResult']:
     """
     Executa suite de testes.
 
     Args:
         suite: Nome da suite de testes.
+        workers: Processos do pytest-xdist para suites paralelas; por padrão,
+            todo o orçamento de núcleos.
 
     Returns:
         Resultado dos testes ou None em caso de erro.
@@ -209,38 +398,68 @@ def run_tests(suite: str) -> Optional[unittest.TestResult]:
 
         print(f'\nExecutando suite {suite}...')
 
-        # Configura cobertura
-        if TEST_CONFIG['coverage']['enabled']:
+        # Cobertura pode ser desligada por suite (ex.: testes de sistema)
+        measure_coverage = TEST_CONFIG['coverage']['enabled'] and config.get('coverage', True)
+
+        if measure_coverage and TEST_CONFIG['coverage']['engine'] == 'slipcover':
+            return _run_tests_slipcover(suite, config)
+
+        args, junit_path = _pytest_args(suite, config)
+
+        # Suites paralelas são distribuídas entre os núcleos com pytest-xdist,
+        # se instalado; com cobertura, os processos filhos só são medidos pelo
+        # pytest-cov, então sem ele a suite roda no próprio processo
+        use_xdist = config['parallel'] and importlib.util.find_spec('xdist') is not None
+        if use_xdist and measure_coverage and importlib.util.find_spec('pytest_cov') is None:
+            use_xdist = False
+        if use_xdist:
+            args.extend(['-n', str(workers or _xdist_budget())])
+
+        # Configura cobertura; com pytest-xdist os testes rodam em processos
+        # filhos, então a coleta fica a cargo do pytest-cov
+        if measure_coverage:
+            import coverage
+
             cov = coverage.Coverage(
                 branch=TEST_CONFIG['coverage']['branch'],
                 source=TEST_CONFIG['coverage']['source'],
                 omit=TEST_CONFIG['coverage']['omit']
             )
-            cov.start()
-
-        # Executa testes
-        loader = unittest.TestLoader()
-        tests = loader.discover(
-            config['directory'],
-            pattern=config['pattern']
-        )
-
-        runner = unittest.TextTestRunner(
-            verbosity=2,
-            failfast=False
-        )
+            if use_xdist:
+                args.extend(f'--cov={source}' for source in TEST_CONFIG['coverage']['source'])
+                args.append('--cov-report=')
+                if TEST_CONFIG['coverage']['branch']:
+                    args.append('--cov-branch')
+            else:
+                cov.start()
+
+        # Executa testes; pytest retorna 1 quando há falhas e 5 quando
+        # nenhum teste é coletado
+        import pytest
+
+        exit_code = pytest.main(args)
+
+        if measure_coverage:
+            if use_xdist:
+                cov.load()
+            else:
+                cov.stop()
+                cov.save()
+
+        if exit_code not in (0, 1, 5):
+            print(f'Erro ao executar pytest (código {exit_code})', file=sys.stderr)
+            return None
 
-        result = runner.run(tests)
+        result = _result_from_junit(junit_path)
 
         # Gera relatório de cobertura
-        if TEST_CONFIG['coverage']['enabled']:
-            cov.stop()
-            cov.save()
-
-            # Relatório em texto
-            cov.report(
+        if measure_coverage:
+            # Relatório em texto; o percentual retornado é reaproveitado
+            # na verificação de cobertura mínima
+            percent = cov.report(
                 show_missing=TEST_CONFIG['coverage']['report']['show_missing'],
-                skip_covered=TEST_CONFIG['coverage']['report']['skip_covered']
+                skip_covered=TEST_CONFIG['coverage']['report']['skip_covered'],
+                ignore_errors=True
             )
 
             # Relatório HTML
@@ -260,7 +479,7 @@ def run_tests(suite: str) -> Optional[unittest.TestResult]:
             )
 
             # Verifica cobertura mínima
-            if cov.report() < TEST_CONFIG['coverage']['report']['fail_under']:
+            if percent < TEST_CONFIG['coverage']['report']['fail_under']:
                 print('\nCobertura abaixo do mínimo exigido.', file=sys.stderr)
                 return None
 
@@ -269,7 +488,179 @@ def run_tests(suite: str) -> Optional[unittest.TestResult]:
         print(f'Erro ao executar testes: {e}', file=sys.stderr)
         return None
 
-def generate_report(results: Dict[str, unittest.TestResult]) -> bool:
+def _run_tests_worker(suite: str, workers: int) -> Optional[Tuple[int, List, List, List]]:
+    """
+    Executa uma suite em um processo filho.
+
+    Cada suite grava a cobertura em seu próprio arquivo de dados, e o
+    resultado volta ao processo pai em forma serializável.
+
+    Args:
+        suite: Nome da suite de testes.
+        workers: Processos do pytest-xdist da suite.
+
+    Returns:
+        Uma tupla (testes, erros, falhas, ignorados) ou None em caso de erro.
+    """
+    os.environ['COVERAGE_FILE'] = f'.coverage.{suite}'
+    result = run_tests(suite, workers)
+    if result is None:
+        return None
+    return result.testsRun, result.errors, result.failures, result.skipped
+
+# Seções de detalhes dos relatórios: (chave, título, classe CSS / tag XML)
+_REPORT_SECTIONS = (
+    ('errors', 'Erros', 'error'),
+    ('failures', 'Falhas', 'failure'),
+    ('skipped', 'Ignorados', 'skipped')
+)
+
+# Tamanho do buffer de escrita dos relatórios
+_REPORT_BUFFER_SIZE = 1 << 20
+
+# Modelo da página do relatório HTML
+_HTML_TEMPLATE = string.Template('''<!DOCTYPE html>
+<html>
+<head>
+  <title>Relatório de Testes</title>
+  <style>
+    body { font-family: sans-serif; margin: 2em; }
+    h1 { color: #333; }
+    .summary { margin: 1em 0; }
+    .suite { margin: 2em 0; }
+    .error { color: red; }
+    .failure { color: orange; }
+    .skipped { color: gray; }
+  </style>
+</head>
+<body>
+  <h1>Relatório de Testes</h1>
+$body</body>
+</html>
+''')
+
+def _render_txt_report(summary: Dict, suites: List[Dict]) -> str:
+    """
+    Gera o conteúdo do relatório em texto.
+
+    Args:
+        summary: Resumo dos testes.
+        suites: Dados das suites.
+
+    Returns:
+        Conteúdo do relatório.
+    """
+    parts = ['=== Relatório de Testes ===\n\n']
+
+    # Resumo
+    if TEST_CONFIG['reports']['sections']['summary']:
+        parts.append('Resumo\n------\n')
+        parts.extend(f'{key}: {value}\n' for key, value in summary.items())
+        parts.append('\n')
+
+    # Detalhes por suite
+    for suite in suites:
+        name = suite['name']
+        parts.append(f'Suite: {name}\n{"-" * (7 + len(name))}\nTests: {suite["tests"]}\n')
+        if suite['has_details']:
+            for key, title, _ in _REPORT_SECTIONS:
+                if suite[key]:
+                    parts.append(f'\n{title}:\n')
+                    parts.extend(f'- {test}\n  {detail}\n' for test, detail in suite[key])
+        parts.append('\n')
+
+    return ''.join(parts)
+
+def _render_html_report(summary: Dict, suites: List[Dict]) -> str:
+    """
+    Gera o conteúdo do relatório HTML.
+
+    Args:
+        summary: Resumo dos testes.
+        suites: Dados das suites.
+
+    Returns:
+        Conteúdo do relatório.
+    """
+    parts = []
+
+    if TEST_CONFIG['reports']['sections']['summary']:
+        parts.append('  <div class="summary">\n    <h2>Resumo</h2>\n    <ul>\n')
+        parts.extend(f'      <li>{key}: {value}</li>\n' for key, value in summary.items())
+        parts.append('    </ul>\n  </div>\n')
+
+    for suite in suites:
+        parts.append(f'  <div class="suite">\n    <h2>Suite: {escape(suite["name"])}</h2>\n'
+                     f'    <p>Tests: {suite["tests"]}</p>\n')
+        if not suite['has_details']:
+            if not any(suite['counts']):
+                parts.append('    <p>Todos os testes passaram.</p>\n')
+        else:
+            for key, title, css_class in _REPORT_SECTIONS:
+                if suite[key]:
+                    parts.append(f'    <h3>{title}</h3>\n    <ul class="{css_class}">\n')
+                    parts.extend(f'      <li>{escape(str(test))}<br><pre>{escape(str(detail))}</pre></li>\n'
+                                 for test, detail in suite[key])
+                    parts.append('    </ul>\n')
+        parts.append('  </div>\n')
+
+    return _HTML_TEMPLATE.substitute(body=''.join(parts))
+
+def _write_xml_report(report_path: str, suites: List[Dict]) -> None:
+    """
+    Grava o relatório XML no formato JUnit.
+
+    Args:
+        report_path: Caminho do relatório.
+        suites: Dados das suites.
+    """
+    root = ET.Element('testsuites')
+    for suite in suites:
+        errors, failures, skipped = suite['counts']
+        node = ET.SubElement(root, 'testsuite', name=suite['name'],
+                             tests=str(suite['tests']), errors=str(errors),
+                             failures=str(failures), skipped=str(skipped))
+        if not suite['has_details']:
+            continue
+        for key, _, tag in _REPORT_SECTIONS:
+            for test, detail in suite[key]:
+                case = ET.SubElement(node, 'testcase', name=str(test))
+                if tag == 'skipped':
+                    ET.SubElement(case, tag, message=str(detail))
+                else:
+                    ET.SubElement(case, tag, message=detail.partition('\n')[0]).text = detail
+
+    ET.indent(root)
+
+    # O ElementTree serializa em muitos pedaços pequenos; o buffer grande
+    # agrupa tudo em poucas chamadas de escrita
+    with open(report_path, 'wb', buffering=_REPORT_BUFFER_SIZE) as f:
+        ET.ElementTree(root).write(f, encoding='utf-8', xml_declaration=True)
+
+def _write_report(report_format: str, report_path: str, summary: Dict, suites: List[Dict]) -> None:
+    """
+    Grava o relatório em um formato.
+
+    Args:
+        report_format: Formato do relatório (txt, html ou xml).
+        report_path: Caminho do relatório.
+        summary: Resumo dos testes.
+        suites: Dados das suites.
+    """
+    if report_format == 'xml':
+        _write_xml_report(report_path, suites)
+        return
+
+    if report_format == 'txt':
+        content = _render_txt_report(summary, suites)
+    elif report_format == 'html':
+        content = _render_html_report(summary, suites)
+    else:
+        return
+
+    Path(report_path).write_text(content, encoding='utf-8')
+
+def generate_report(results: Dict[str, 'unittest.TestResult']) -> bool:
     """
     Gera relatório de testes.
 
@@ -287,159 +678,56 @@ def generate_report(results: Dict[str, unittest.TestResult]) -> bool:
 
         # Prepara dados
         timestamp = datetime.now()
+
+        sections = TEST_CONFIG['reports']['sections']
+        show_errors = sections['errors']
+        show_failures = sections['failures']
+        show_skipped = sections['skipped']
+
+        # Dados das suites e totais, montados numa única passada
+        suites = []
+        total_tests = total_errors = total_failures = total_skipped = 0
+        for suite, result in results.items():
+            errors, failures, skipped = len(result.errors), len(result.failures), len(result.skipped)
+            total_tests += result.testsRun
+            total_errors += errors
+            total_failures += failures
+            total_skipped += skipped
+            details = {
+                'errors': result.errors if show_errors else [],
+                'failures': result.failures if show_failures else [],
+                'skipped': result.skipped if show_skipped else []
+            }
+            suites.append({
+                'name': suite,
+                'tests': result.testsRun,
+                'counts': (errors, failures, skipped),
+                'has_details': any(details.values()),
+                **details
+            })
+
         summary = {
             'timestamp': timestamp.isoformat(),
             'suites': len(results),
-            'tests': sum(result.testsRun for result in results.values()),
-            'errors': sum(len(result.errors) for result in results.values()),
-            'failures': sum(len(result.failures) for result in results.values()),
-            'skipped': sum(len(result.skipped) for result in results.values())
+            'tests': total_tests,
+            'errors': total_errors,
+            'failures': total_failures,
+            'skipped': total_skipped
         }
 
-        # Gera relatórios
-        for format in TEST_CONFIG['reports']['formats']:
-            report_path = os.path.join(
-                TEST_CONFIG['directories']['reports'],
-                f'report_{timestamp.strftime("%Y%m%d_%H%M%S")}.{format}'
-            )
-
-            if format == 'txt':
-                with open(report_path, 'w') as f:
-                    # Cabeçalho
-                    f.write('=== Relatório de Testes ===\n\n')
-
-                    # Resumo
-                    if TEST_CONFIG['reports']['sections']['summary']:
-                        f.write('Resumo\n')
-                        f.write('------\n')
-                        for key, value in summary.items():
-                            f.write(f'{key}: {value}\n')
-                        f.write('\n')
-
-                    # Detalhes por suite
-                    for suite, result in results.items():
-                        f.write(f'Suite: {suite}\n')
-                        f.write('-' * (7 + len(suite)) + '\n')
-                        f.write(f'Tests: {result.testsRun}\n')
-
-                        if TEST_CONFIG['reports']['sections']['errors'] and result.errors:
-                            f.write('\nErros:\n')
-                            for test, error in result.errors:
-                                f.write(f'- {test}\n')
-                                f.write(f'  {error}\n')
-
-                        if TEST_CONFIG['reports']['sections']['failures'] and result.failures:
-                            f.write('\nFalhas:\n')
-                            for test, failure in result.failures:
-                                f.write(f'- {test}\n')
-                                f.write(f'  {failure}\n')
-
-                        if TEST_CONFIG['reports']['sections']['skipped'] and result.skipped:
-                            f.write('\nIgnorados:\n')
-                            for test, reason in result.skipped:
-                                f.write(f'- {test}\n')
-                                f.write(f'  {reason}\n')
-
-                        f.write('\n')
-
-            elif format == 'html':
-                with open(report_path, 'w') as f:
-                    f.write('<!DOCTYPE html>\n')
-                    f.write('<html>\n')
-                    f.write('<head>\n')
-                    f.write('  <title>Relatório de Testes</title>\n')
-                    f.write('  <style>\n')
-                    f.write('    body { font-family: sans-serif; margin: 2em; }\n')
-                    f.write('    h1 { color: #333; }\n')
-                    f.write('    .summary { margin: 1em 0; }\n')
-                    f.write('    .suite { margin: 2em 0; }\n')
-                    f.write('    .error { color: red; }\n')
-                    f.write('    .failure { color: orange; }\n')
-                    f.write('    .skipped { color: gray; }\n')
-                    f.write('  </style>\n')
-                    f.write('</head>\n')
-                    f.write('<body>\n')
-
-                    f.write('  <h1>Relatório de Testes</h1>\n')
-
-                    if TEST_CONFIG['reports']['sections']['summary']:
-                        f.write('  <div class="summary">\n')
-                        f.write('    <h2>Resumo</h2>\n')
-                        f.write('    <ul>\n')
-                        for key, value in summary.items():
-                            f.write(f'      <li>{key}: {value}</li>\n')
-                        f.write('    </ul>\n')
-                        f.write('  </div>\n')
-
-                    for suite, result in results.items():
-                        f.write('  <div class="suite">\n')
-                        f.write(f'    <h2>Suite: {suite}</h2>\n')
-                        f.write(f'    <p>Tests: {result.testsRun}</p>\n')
-
-                        if TEST_CONFIG['reports']['sections']['errors'] and result.errors:
-                            f.write('    <h3>Erros</h3>\n')
-                            f.write('    <ul class="error">\n')
-                            for test, error in result.errors:
-                                f.write(f'      <li>{test}<br><pre>{error}</pre></li>\n')
-                            f.write('    </ul>\n')
-
-                        if TEST_CONFIG['reports']['sections']['failures'] and result.failures:
-                            f.write('    <h3>Falhas</h3>\n')
-                            f.write('    <ul class="failure">\n')
-                            for test, failure in result.failures:
-                                f.write(f'      <li>{test}<br><pre>{failure}</pre></li>\n')
-                            f.write('    </ul>\n')
-
-                        if TEST_CONFIG['reports']['sections']['skipped'] and result.skipped:
-                            f.write('    <h3>Ignorados</h3>\n')
-                            f.write('    <ul class="skipped">\n')
-                            for test, reason in result.skipped:
-                                f.write(f'      <li>{test}<br><pre>{reason}</pre></li>\n')
-                            f.write('    </ul>\n')
-
-                        f.write('  </div>\n')
-
-                    f.write('</body>\n')
-                    f.write('</html>\n')
-
-            elif format == 'xml':
-                with open(report_path, 'w') as f:
-                    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                    f.write('<testsuites>\n')
-
-                    for suite, result in results.items():
-                        f.write(f'  <testsuite name="{suite}" ')
-                        f.write(f'tests="{result.testsRun}" ')
-                        f.write(f'errors="{len(result.errors)}" ')
-                        f.write(f'failures="{len(result.failures)}" ')
-                        f.write(f'skipped="{len(result.skipped)}">\n')
-
-                        if TEST_CONFIG['reports']['sections']['errors']:
-                            for test, error in result.errors:
-                                f.write(f'    <testcase name="{test}">\n')
-                                f.write('      <error ')
-                                f.write(f'message="{error.splitlines()[0]}">')
-                                f.write(f'<![CDATA[{error}]]></error>\n')
-                                f.write('    </testcase>\n')
-
-                        if TEST_CONFIG['reports']['sections']['failures']:
-                            for test, failure in result.failures:
-                                f.write(f'    <testcase name="{test}">\n')
-                                f.write('      <failure ')
-                                f.write(f'message="{failure.splitlines()[0]}">')
-                                f.write(f'<![CDATA[{failure}]]></failure>\n')
-                                f.write('    </testcase>\n')
-
-                        if TEST_CONFIG['reports']['sections']['skipped']:
-                            for test, reason in result.skipped:
-                                f.write(f'    <testcase name="{test}">\n')
-                                f.write('      <skipped ')
-                                f.write(f'message="{reason}"/>\n')
-                                f.write('    </testcase>\n')
-
-                        f.write('  </testsuite>\n')
-
-                    f.write('</testsuites>\n')
+        # Gera os relatórios de cada formato em paralelo
+        reports_dir = TEST_CONFIG['directories']['reports']
+        report_name = f'report_{timestamp.strftime("%Y%m%d_%H%M%S")}'
+        formats = TEST_CONFIG['reports']['formats']
+        with ThreadPoolExecutor(max_workers=max(len(formats), 1)) as executor:
+            list(executor.map(
+                lambda report_format: _write_report(
+                    report_format,
+                    os.path.join(reports_dir, f'{report_name}.{report_format}'),
+                    summary, suites
+                ),
+                formats
+            ))
 
         print('Relatório gerado com sucesso.')
         return True
@@ -476,7 +764,15 @@ def setup_logging() -> bool:
         handler.setFormatter(logging.Formatter(
             TEST_CONFIG['logging']['format']
         ))
-        logger.addHandler(handler)
+
+        # A escrita em disco fica numa thread de fundo; o logger só enfileira
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
 
         return True
     except Exception as e:
@@ -525,14 +821,41 @@ def main() -> int:
                 if config['enabled']
             ]
 
-        # Executa testes
+        # Executa as suites paralelas simultaneamente, cada uma em seu processo
+        concurrent = [suite for suite in suites if TEST_CONFIG['suites'][suite]['parallel']]
+        if len(concurrent) < 2:
+            concurrent = []
+
         results = {}
+        if concurrent:
+            import unittest
+
+            # Os núcleos são divididos entre as suites simultâneas, para que
+            # os processos do pytest-xdist de todas somados não excedam o total
+            workers = max(_xdist_budget() // len(concurrent), 1)
+            with ProcessPoolExecutor(max_workers=len(concurrent)) as executor:
+                futures = {suite: executor.submit(_run_tests_worker, suite, workers)
+                           for suite in concurrent}
+            for suite, future in futures.items():
+                data = future.result()
+                if data is None:
+                    return 1
+                result = unittest.TestResult()
+                result.testsRun, result.errors, result.failures, result.skipped = data
+                results[suite] = result
+
+        # Suites restantes rodam em série no processo principal
         for suite in suites:
+            if suite in results:
+                continue
             result = run_tests(suite)
             if not result:
                 return 1
             results[suite] = result
 
+        # Mantém a ordem original das suites no relatório
+        results = {suite: results[suite] for suite in suites}
+
         # Gera relatório
         if not generate_report(results):
             return 1
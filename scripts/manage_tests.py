@@ -5,14 +5,25 @@
 Script para gerenciar os testes do emulador.
 """
 
-import json
 import os
+import re
+import string
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 import subprocess
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from manage_common import atomic_write_bytes, dumps, read_json
+
+try:
+    from lxml import etree as ET
+    _LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _LXML = False
 
 # Tipos de testes
 TEST_TYPES = {
@@ -52,6 +63,53 @@ TEST_CATEGORIES = [
     'other'        # Outros testes
 ]
 
+# Prefixos de categoria em uma única expressão; as alternativas são tentadas
+# na ordem de TEST_CATEGORIES, como na busca linear que substituem
+_CATEGORY_RE = re.compile('|'.join(map(re.escape, TEST_CATEGORIES)))
+_CATEGORY_INDEX = {category: i for i, category in enumerate(TEST_CATEGORIES)}
+
+# Contadores de cada categoria, na ordem das linhas das análises parciais
+_COUNTER_KEYS = ('total', 'passed', 'failed', 'skipped')
+
+# Quantidade de arquivos de resultado a partir da qual a análise usa processos
+_PARALLEL_MIN_FILES = 8
+
+# Cache das análises por arquivo, invalidado por mtime e tamanho
+ANALYSIS_CACHE_PATH = 'tests/.analysis_cache/results.json'
+_ANALYSIS_CACHE_VERSION = 2
+
+# Modelo de arquivo de teste; usa $campos para não colidir com as chaves do C++
+_TEST_TEMPLATE = string.Template('''/**
+ * $title Test
+ * Tipo: $description
+ * Categoria: $category
+ * Data: $date
+ */
+
+#include <gtest/gtest.h>
+#include <gmock/gmock.h>
+
+namespace {
+
+class ${cls}Test : public ::testing::Test {
+protected:
+    void SetUp() override {
+        // TODO: Inicialização
+    }
+
+    void TearDown() override {
+        // TODO: Limpeza
+    }
+};
+
+TEST_F(${cls}Test, ShouldPass) {
+    // TODO: Implementar teste
+    EXPECT_TRUE(true);
+}
+
+}  // namespace
+''')
+
 def create_test_directories() -> bool:
     """
     Cria a estrutura de diretórios para testes.
@@ -60,14 +118,11 @@ def create_test_directories() -> bool:
         True se os diretórios foram criados com sucesso, False caso contrário.
     """
     try:
-        # Cria diretórios principais
-        dirs = ['tests']
-        for test_type in TEST_TYPES:
-            dirs.append(TEST_TYPES[test_type]['directory'])
-            dirs.append(f"{TEST_TYPES[test_type]['directory']}/results")
-
-        for directory in dirs:
-            os.makedirs(directory, exist_ok=True)
+        # Cria só os diretórios folha; parents=True cria 'tests' e os
+        # diretórios de cada tipo no caminho
+        dirs = {f"{test_type['directory']}/results" for test_type in TEST_TYPES.values()}
+        for directory in sorted(dirs):
+            Path(directory).mkdir(parents=True, exist_ok=True)
 
         return True
     except Exception as e:
@@ -106,30 +161,13 @@ def create_test_template(test_type: str, category: str, name: str) -> bool:
             return False
 
         # Cria arquivo de teste
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write(f'/**\n')
-            f.write(f' * {name.replace("_", " ").title()} Test\n')
-            f.write(f' * Tipo: {TEST_TYPES[test_type]["description"]}\n')
-            f.write(f' * Categoria: {category}\n')
-            f.write(f' * Data: {datetime.now().strftime("%Y-%m-%d")}\n')
-            f.write(f' */\n\n')
-            f.write('#include <gtest/gtest.h>\n')
-            f.write('#include <gmock/gmock.h>\n\n')
-            f.write('namespace {\n\n')
-            f.write(f'class {name.title()}Test : public ::testing::Test {{\n')
-            f.write('protected:\n')
-            f.write('    void SetUp() override {\n')
-            f.write('        // TODO: Inicialização\n')
-            f.write('    }\n\n')
-            f.write('    void TearDown() override {\n')
-            f.write('        // TODO: Limpeza\n')
-            f.write('    }\n')
-            f.write('};\n\n')
-            f.write(f'TEST_F({name.title()}Test, ShouldPass) {{\n')
-            f.write('    // TODO: Implementar teste\n')
-            f.write('    EXPECT_TRUE(true);\n')
-            f.write('}\n\n')
-            f.write('}  // namespace\n')
+        Path(test_file).write_text(_TEST_TEMPLATE.substitute(
+            title=name.replace('_', ' ').title(),
+            description=TEST_TYPES[test_type]['description'],
+            category=category,
+            date=datetime.now().strftime('%Y-%m-%d'),
+            cls=name.title()
+        ), encoding='utf-8')
 
         print(f'Teste criado em: {test_file}')
         return True
@@ -184,23 +222,20 @@ def run_tests(test_type: Optional[str] = None, category: Optional[str] = None,
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 result_file = f'{test_dir}/results/test_result_{timestamp}.xml'
 
-                # Executa testes
-                print(f'\nExecutando testes em {test_dir}...')
-                result = subprocess.run(
-                    ['ctest', '--test-dir', 'build',
-                     '--output-junit', result_file,
-                     '--output-on-failure',
-                     f'--tests-regex={filter_str}' if filter_str else ''],
-                    capture_output=True,
-                    text=True
-                )
+                # Executa testes; a saída do ctest vai direto para o terminal
+                # e os detalhes das falhas ficam no JUnit XML
+                print(f'\nExecutando testes em {test_dir}...', flush=True)
+                command = ['ctest', '--test-dir', 'build',
+                           '--output-junit', result_file,
+                           '--output-on-failure']
+                if filter_str:
+                    command.append(f'--tests-regex={filter_str}')
+                result = subprocess.run(command)
 
                 # Verifica resultado
                 if result.returncode != 0:
                     success = False
-                    print('Falha nos testes:', file=sys.stderr)
-                    print(result.stdout)
-                    print(result.stderr, file=sys.stderr)
+                    print('Falha nos testes.', file=sys.stderr)
                 else:
                     print('Testes concluídos com sucesso.')
 
@@ -209,9 +244,202 @@ def run_tests(test_type: Optional[str] = None, category: Optional[str] = None,
         print(f'Erro ao executar testes: {e}', file=sys.stderr)
         return False
 
+def _iter_testsuites(path: str):
+    """
+    Percorre as suites de um arquivo JUnit XML sem carregar a árvore inteira.
+
+    Cada suite é liberada da memória assim que o chamador termina de processá-la.
+
+    Args:
+        path: Caminho do arquivo XML.
+
+    Yields:
+        Elementos testsuite, na ordem do arquivo.
+    """
+    if _LXML:
+        # O lxml filtra as tags no próprio parser, sem eventos em Python
+        for _, elem in ET.iterparse(path, events=('end',), tag='testsuite'):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    context = ET.iterparse(path, events=('start', 'end'))
+    _, root = next(context)
+    for event, elem in context:
+        if event == 'end' and elem.tag == 'testsuite':
+            yield elem
+            elem.clear()
+            # Descarta as suites já processadas presas à raiz
+            if elem is not root:
+                del root[:]
+
+def _new_partial() -> Dict:
+    """
+    Cria uma análise parcial com todos os contadores zerados.
+
+    Os contadores ficam em uma linha [total, passou, falhou, ignorado] por
+    categoria, na ordem de TEST_CATEGORIES, e só viram o dicionário completo
+    em _build_analysis.
+
+    Returns:
+        Análise parcial vazia.
+    """
+    return {
+        'counts': [[0] * len(_COUNTER_KEYS) for _ in TEST_CATEGORIES],
+        'time': 0.0,
+        'failures': []
+    }
+
+def _add_percentages(stats: Dict) -> None:
+    """
+    Calcula os percentuais de passou/falhou/ignorado sobre o total.
+
+    Um total zero não gera divisão por zero: os percentuais ficam em 0.
+
+    Args:
+        stats: Contadores, alterados no lugar com as chaves pct_*.
+    """
+    total = stats['total'] or 1
+    for key in ('passed', 'failed', 'skipped'):
+        stats[f'pct_{key}'] = stats[key] / total * 100
+
+def _build_analysis(partial_analysis: Dict) -> Dict:
+    """
+    Expande uma análise parcial no dicionário de análise completo.
+
+    Args:
+        partial_analysis: Análise parcial acumulada.
+
+    Returns:
+        Dicionário com análise dos resultados.
+    """
+    analysis = dict.fromkeys(_COUNTER_KEYS, 0)
+    analysis['time'] = partial_analysis['time']
+    analysis['by_category'] = {}
+    analysis['failures'] = partial_analysis['failures']
+
+    for category, row in zip(TEST_CATEGORIES, partial_analysis['counts']):
+        stats = dict(zip(_COUNTER_KEYS, row))
+        _add_percentages(stats)
+        analysis['by_category'][category] = stats
+        for key, value in zip(_COUNTER_KEYS, row):
+            analysis[key] += value
+    _add_percentages(analysis)
+
+    return analysis
+
+def _new_analysis() -> Dict:
+    """
+    Cria um dicionário de análise com todos os contadores zerados.
+
+    Returns:
+        Dicionário de análise vazio.
+    """
+    return _build_analysis(_new_partial())
+
+def _parse_result_file(path: str, details: bool = True) -> Dict:
+    """
+    Analisa um único arquivo de resultado.
+
+    Executado nos processos de trabalho de analyze_results; o retorno contém
+    apenas tipos simples para ser serializado de volta ao processo principal.
+
+    Args:
+        path: Caminho do arquivo XML.
+        details: Se False, o texto das falhas (pilhas de chamadas) é descartado.
+
+    Returns:
+        Análise parcial do arquivo.
+    """
+    partial_analysis = _new_partial()
+    counts = partial_analysis['counts']
+
+    for test_suite in _iter_testsuites(path):
+        # Extrai categoria do nome do teste
+        suite_name = test_suite.get('name', '')
+        # Caso comum (categoria_nome): uma busca no dicionário; nomes sem o
+        # separador caem na expressão de prefixos
+        category = suite_name.partition('_')[0]
+        if category not in _CATEGORY_INDEX:
+            match = _CATEGORY_RE.match(suite_name)
+            category = match.group() if match else 'other'
+
+        # Atualiza contadores
+        tests = int(test_suite.get('tests', 0))
+        failures = int(test_suite.get('failures', 0))
+        skipped = int(test_suite.get('skipped', 0))
+        partial_analysis['time'] += float(test_suite.get('time', 0))
+
+        row = counts[_CATEGORY_INDEX[category]]
+        row[0] += tests
+        row[1] += tests - failures - skipped
+        row[2] += failures
+        row[3] += skipped
+
+        # Registra falhas
+        for test_case in test_suite.iter('testcase'):
+            failure = test_case.find('failure')
+            if failure is not None:
+                partial_analysis['failures'].append({
+                    'suite': suite_name,
+                    'test': test_case.get('name', ''),
+                    'message': failure.get('message', ''),
+                    'details': failure.text if details else None
+                })
+
+    return partial_analysis
+
+def _merge_partial(total: Dict, partial_analysis: Dict) -> None:
+    """
+    Soma uma análise parcial à análise parcial acumulada.
+
+    Args:
+        total: Análise parcial acumulada, alterada no lugar.
+        partial_analysis: Análise parcial de um arquivo.
+    """
+    for row, values in zip(total['counts'], partial_analysis['counts']):
+        for i, value in enumerate(values):
+            row[i] += value
+    total['time'] += partial_analysis['time']
+    total['failures'].extend(partial_analysis['failures'])
+
+def _load_analysis_cache() -> Dict:
+    """
+    Carrega o cache de análises por arquivo.
+
+    Returns:
+        Dicionário caminho -> entrada, vazio se o cache não existir, for
+        inválido ou tiver sido gravado em outro formato.
+    """
+    try:
+        cache = read_json(ANALYSIS_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != _ANALYSIS_CACHE_VERSION:
+        return {}
+    return cache['files']
+
+def _save_analysis_cache(cache: Dict) -> None:
+    """
+    Salva o cache de análises por arquivo.
+
+    Args:
+        cache: Dicionário caminho -> entrada.
+    """
+    try:
+        os.makedirs(os.path.dirname(ANALYSIS_CACHE_PATH), exist_ok=True)
+        payload = {'version': _ANALYSIS_CACHE_VERSION, 'files': cache}
+        atomic_write_bytes(ANALYSIS_CACHE_PATH, dumps(payload))
+    except OSError as e:
+        print(f'Aviso: não foi possível salvar o cache de análise: {e}', file=sys.stderr)
+
 def analyze_results(test_type: Optional[str] = None,
                    start_time: Optional[str] = None,
-                   end_time: Optional[str] = None) -> Dict:
+                   end_time: Optional[str] = None,
+                   use_cache: bool = True,
+                   details: bool = True) -> Dict:
     """
     Analisa resultados dos testes.
 
@@ -219,29 +447,15 @@ def analyze_results(test_type: Optional[str] = None,
         test_type: Tipo de teste para filtrar (opcional).
         start_time: Data/hora inicial para filtrar (opcional).
         end_time: Data/hora final para filtrar (opcional).
+        use_cache: Se True, reaproveita análises de arquivos inalterados.
+        details: Se False, guarda só suite, teste e mensagem de cada falha,
+            sem o texto completo, reduzindo a memória em execuções grandes.
 
     Returns:
         Dicionário com análise dos resultados.
     """
     try:
-        analysis = {
-            'total': 0,
-            'passed': 0,
-            'failed': 0,
-            'skipped': 0,
-            'time': 0.0,
-            'by_category': {},
-            'failures': []
-        }
-
-        # Inicializa contadores por categoria
-        for category in TEST_CATEGORIES:
-            analysis['by_category'][category] = {
-                'total': 0,
-                'passed': 0,
-                'failed': 0,
-                'skipped': 0
-            }
+        analysis = _new_analysis()
 
         # Define diretórios a analisar
         result_dirs = []
@@ -254,66 +468,110 @@ def analyze_results(test_type: Optional[str] = None,
             for test_type in TEST_TYPES:
                 result_dirs.append(f"{TEST_TYPES[test_type]['directory']}/results")
 
-        # Analisa arquivos de resultado
+        # Seleciona arquivos de resultado; o scandir já informa nome, caminho
+        # e metadados de cada entrada
+        entries = []
+        filter_time = bool(start_time or end_time)
         for result_dir in result_dirs:
-            if not os.path.exists(result_dir):
+            try:
+                with os.scandir(result_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith('.xml'):
+                            continue
+
+                        # Extrai timestamp do nome do arquivo (terceiro campo
+                        # de test_result_AAAAMMDD_HHMMSS.xml) só se houver filtro
+                        if filter_time:
+                            timestamp = (entry.name.partition('_')[2].partition('_')[2]
+                                         .partition('_')[0].partition('.')[0])
+                            if start_time and timestamp < start_time:
+                                continue
+                            if end_time and timestamp > end_time:
+                                continue
+
+                        entries.append(entry)
+            except FileNotFoundError:
                 continue
 
-            for result_file in os.listdir(result_dir):
-                if not result_file.endswith('.xml'):
-                    continue
-
-                # Extrai timestamp do nome do arquivo
-                timestamp = result_file.split('_')[2].split('.')[0]
-                if start_time and timestamp < start_time:
-                    continue
-                if end_time and timestamp > end_time:
+        # Arquivos de resultado não mudam depois de gravados; só os novos ou
+        # alterados desde a última análise precisam ser lidos
+        cache = _load_analysis_cache() if use_cache else {}
+        partials = {}
+        missing = []
+        for entry in entries:
+            cached = cache.get(os.path.abspath(entry.path)) if use_cache else None
+            # Entradas gravadas sem detalhes só servem quando eles não são pedidos
+            if cached is not None and (cached.get('details', True) or not details):
+                st = entry.stat()
+                if cached['mtime'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                    partials[entry.path] = cached['analysis']
                     continue
-
-                # Carrega arquivo XML
-                tree = ET.parse(f'{result_dir}/{result_file}')
-                root = tree.getroot()
-
-                # Analisa resultados
-                for test_suite in root.findall('.//testsuite'):
-                    # Extrai categoria do nome do teste
-                    suite_name = test_suite.get('name', '')
-                    category = next((c for c in TEST_CATEGORIES
-                                  if suite_name.startswith(c)), 'other')
-
-                    # Atualiza contadores
-                    tests = int(test_suite.get('tests', 0))
-                    failures = int(test_suite.get('failures', 0))
-                    skipped = int(test_suite.get('skipped', 0))
-                    time = float(test_suite.get('time', 0))
-
-                    analysis['total'] += tests
-                    analysis['failed'] += failures
-                    analysis['skipped'] += skipped
-                    analysis['passed'] += (tests - failures - skipped)
-                    analysis['time'] += time
-
-                    analysis['by_category'][category]['total'] += tests
-                    analysis['by_category'][category]['failed'] += failures
-                    analysis['by_category'][category]['skipped'] += skipped
-                    analysis['by_category'][category]['passed'] += (tests - failures - skipped)
-
-                    # Registra falhas
-                    for test_case in test_suite.findall('.//testcase'):
-                        failure = test_case.find('failure')
-                        if failure is not None:
-                            analysis['failures'].append({
-                                'suite': suite_name,
-                                'test': test_case.get('name', ''),
-                                'message': failure.get('message', ''),
-                                'details': failure.text
-                            })
+            missing.append(entry)
+
+        # Os arquivos são independentes; com muitos deles, a análise é
+        # distribuída entre processos
+        missing_paths = [entry.path for entry in missing]
+        if len(missing) >= _PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                parsed = list(executor.map(partial(_parse_result_file, details=details),
+                                           missing_paths, chunksize=8))
+        else:
+            parsed = [_parse_result_file(path, details) for path in missing_paths]
+
+        for entry, partial_analysis in zip(missing, parsed):
+            partials[entry.path] = partial_analysis
+            if use_cache:
+                st = entry.stat()
+                cache[os.path.abspath(entry.path)] = {
+                    'mtime': st.st_mtime_ns,
+                    'size': st.st_size,
+                    'details': details,
+                    'analysis': partial_analysis
+                }
+
+        # Soma os parciais na ordem original dos arquivos
+        total = _new_partial()
+        for entry in entries:
+            _merge_partial(total, partials[entry.path])
+        analysis = _build_analysis(total)
+
+        # As falhas vêm dos parciais guardados no cache; copia em vez de
+        # alterar, para não apagar os detalhes das entradas em cache
+        if not details:
+            analysis['failures'] = [
+                {**failure, 'details': None} for failure in analysis['failures']
+            ]
+
+        if use_cache:
+            # Descarta as entradas de arquivos apagados; as de arquivos fora
+            # desta análise (outro tipo ou período) continuam enquanto existirem
+            seen = {os.path.abspath(entry.path) for entry in entries}
+            stale = [path for path in cache
+                     if path not in seen and not os.path.exists(path)]
+            for path in stale:
+                del cache[path]
+            if missing or stale:
+                _save_analysis_cache(cache)
 
         return analysis
     except Exception as e:
         print(f'Erro ao analisar resultados: {e}', file=sys.stderr)
         return analysis
 
+def _pct_line(label: str, count: int, pct: float) -> str:
+    """
+    Formata uma linha de contagem com percentual para o relatório.
+
+    Args:
+        label: Rótulo da linha.
+        count: Quantidade.
+        pct: Percentual já calculado.
+
+    Returns:
+        Linha Markdown terminada em quebra de linha.
+    """
+    return f'- {label}: {count} ({pct:.1f}%)\n'
+
 def generate_report(analysis: Dict, output_path: str) -> bool:
     """
     Gera relatório de testes.
@@ -329,46 +587,41 @@ def generate_report(analysis: Dict, output_path: str) -> bool:
         # Cria diretório de saída se necessário
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        # Gera relatório em formato Markdown
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('# Relatório de Testes\n\n')
-            f.write(f'Data: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n\n')
+        # Gera relatório em formato Markdown, montado em memória e gravado de uma vez
+        parts = [
+            '# Relatório de Testes\n\n',
+            f'Data: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n\n',
 
             # Resumo
-            f.write('## Resumo\n\n')
-            f.write(f'- Total de testes: {analysis["total"]}\n')
-            f.write(f'- Passou: {analysis["passed"]} ')
-            f.write(f'({analysis["passed"]/analysis["total"]*100:.1f}%)\n')
-            f.write(f'- Falhou: {analysis["failed"]} ')
-            f.write(f'({analysis["failed"]/analysis["total"]*100:.1f}%)\n')
-            f.write(f'- Ignorado: {analysis["skipped"]} ')
-            f.write(f'({analysis["skipped"]/analysis["total"]*100:.1f}%)\n')
-            f.write(f'- Tempo total: {analysis["time"]:.2f}s\n\n')
+            '## Resumo\n\n',
+            f'- Total de testes: {analysis["total"]}\n',
+            _pct_line('Passou', analysis['passed'], analysis['pct_passed']),
+            _pct_line('Falhou', analysis['failed'], analysis['pct_failed']),
+            _pct_line('Ignorado', analysis['skipped'], analysis['pct_skipped']),
+            f'- Tempo total: {analysis["time"]:.2f}s\n\n',
 
             # Por categoria
-            f.write('## Por Categoria\n\n')
-            for category in TEST_CATEGORIES:
-                stats = analysis['by_category'][category]
-                if stats['total'] > 0:
-                    f.write(f'### {category.title()}\n\n')
-                    f.write(f'- Total: {stats["total"]}\n')
-                    f.write(f'- Passou: {stats["passed"]} ')
-                    f.write(f'({stats["passed"]/stats["total"]*100:.1f}%)\n')
-                    f.write(f'- Falhou: {stats["failed"]} ')
-                    f.write(f'({stats["failed"]/stats["total"]*100:.1f}%)\n')
-                    f.write(f'- Ignorado: {stats["skipped"]} ')
-                    f.write(f'({stats["skipped"]/stats["total"]*100:.1f}%)\n\n')
-
-            # Falhas
-            if analysis['failures']:
-                f.write('## Falhas\n\n')
-                for failure in analysis['failures']:
-                    f.write(f'### {failure["suite"]} - {failure["test"]}\n\n')
-                    f.write(f'**Mensagem**: {failure["message"]}\n\n')
-                    f.write('**Detalhes**:\n')
-                    f.write('```\n')
-                    f.write(failure['details'])
-                    f.write('\n```\n\n')
+            '## Por Categoria\n\n'
+        ]
+        for category in TEST_CATEGORIES:
+            stats = analysis['by_category'][category]
+            if stats['total'] > 0:
+                parts.append(f'### {category.title()}\n\n- Total: {stats["total"]}\n')
+                parts.append(_pct_line('Passou', stats['passed'], stats['pct_passed']))
+                parts.append(_pct_line('Falhou', stats['failed'], stats['pct_failed']))
+                parts.append(_pct_line('Ignorado', stats['skipped'], stats['pct_skipped']))
+                parts.append('\n')
+
+        # Falhas
+        if analysis['failures']:
+            parts.append('## Falhas\n\n')
+            for failure in analysis['failures']:
+                parts.append(f'### {failure["suite"]} - {failure["test"]}\n\n'
+                             f'**Mensagem**: {failure["message"]}\n\n')
+                if failure['details'] is not None:
+                    parts.append(f'**Detalhes**:\n```\n{failure["details"]}\n```\n\n')
+
+        Path(output_path).write_text(''.join(parts), encoding='utf-8')
 
         print(f'Relatório gerado em: {output_path}')
         return True
@@ -385,9 +638,9 @@ def print_analysis(analysis: Dict) -> None:
     """
     print('\nResumo dos Testes:')
     print(f'Total: {analysis["total"]}')
-    print(f'Passou: {analysis["passed"]} ({analysis["passed"]/analysis["total"]*100:.1f}%)')
-    print(f'Falhou: {analysis["failed"]} ({analysis["failed"]/analysis["total"]*100:.1f}%)')
-    print(f'Ignorado: {analysis["skipped"]} ({analysis["skipped"]/analysis["total"]*100:.1f}%)')
+    print(f'Passou: {analysis["passed"]} ({analysis["pct_passed"]:.1f}%)')
+    print(f'Falhou: {analysis["failed"]} ({analysis["pct_failed"]:.1f}%)')
+    print(f'Ignorado: {analysis["skipped"]} ({analysis["pct_skipped"]:.1f}%)')
     print(f'Tempo total: {analysis["time"]:.2f}s')
 
     print('\nPor Categoria:')
@@ -396,17 +649,122 @@ def print_analysis(analysis: Dict) -> None:
         if stats['total'] > 0:
             print(f'\n{category.title()}:')
             print(f'  Total: {stats["total"]}')
-            print(f'  Passou: {stats["passed"]} ({stats["passed"]/stats["total"]*100:.1f}%)')
-            print(f'  Falhou: {stats["failed"]} ({stats["failed"]/stats["total"]*100:.1f}%)')
-            print(f'  Ignorado: {stats["skipped"]} ({stats["skipped"]/stats["total"]*100:.1f}%)')
+            print(f'  Passou: {stats["passed"]} ({stats["pct_passed"]:.1f}%)')
+            print(f'  Falhou: {stats["failed"]} ({stats["pct_failed"]:.1f}%)')
+            print(f'  Ignorado: {stats["skipped"]} ({stats["pct_skipped"]:.1f}%)')
 
     if analysis['failures']:
         print('\nFalhas:')
         for failure in analysis['failures']:
             print(f'\n{failure["suite"]} - {failure["test"]}')
             print(f'Mensagem: {failure["message"]}')
-            print('Detalhes:')
-            print(failure['details'])
+            if failure['details'] is not None:
+                print('Detalhes:')
+                print(failure['details'])
+
+def _split_options(args: List[str]) -> Tuple[List[str], Dict[str, bool]]:
+    """
+    Separa as opções --no-cache e --no-details dos argumentos posicionais.
+
+    Args:
+        args: Argumentos do comando.
+
+    Returns:
+        Tupla (argumentos posicionais, parâmetros nomeados de analyze_results).
+    """
+    positional = [arg for arg in args if not arg.startswith('--')]
+    options = {
+        'use_cache': '--no-cache' not in args,
+        'details': '--no-details' not in args
+    }
+    return positional, options
+
+def _cmd_init(args: List[str]) -> int:
+    """
+    Comando init: cria a estrutura de diretórios de testes.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if create_test_directories() else 1
+
+def _cmd_create(args: List[str]) -> int:
+    """
+    Comando create: cria um teste a partir do template.
+
+    Args:
+        args: [tipo, categoria, nome].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if create_test_template(
+        args[0],  # tipo
+        args[1],  # categoria
+        args[2]   # nome
+    ) else 1
+
+def _cmd_run(args: List[str]) -> int:
+    """
+    Comando run: executa os testes.
+
+    Args:
+        args: [tipo, categoria, nome, repetições], todos opcionais.
+
+    Returns:
+        0 se os testes passaram, 1 caso contrário.
+    """
+    test_type = args[0] if len(args) > 0 else None
+    category = args[1] if len(args) > 1 else None
+    name = args[2] if len(args) > 2 else None
+    repeat = int(args[3]) if len(args) > 3 else 1
+
+    return 0 if run_tests(test_type, category, name, repeat) else 1
+
+def _cmd_analyze(args: List[str]) -> int:
+    """
+    Comando analyze: exibe a análise dos resultados.
+
+    Args:
+        args: [tipo, início, fim], opcionais, e opções --no-cache/--no-details.
+
+    Returns:
+        Sempre 0.
+    """
+    args, options = _split_options(args)
+    test_type = args[0] if len(args) > 0 else None
+    start_time = args[1] if len(args) > 1 else None
+    end_time = args[2] if len(args) > 2 else None
+
+    analysis = analyze_results(test_type, start_time, end_time, **options)
+    print_analysis(analysis)
+    return 0
+
+def _cmd_report(args: List[str]) -> int:
+    """
+    Comando report: gera o relatório dos resultados.
+
+    Args:
+        args: [caminho do relatório] e opções --no-cache/--no-details.
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    args, options = _split_options(args)
+    analysis = analyze_results(**options)
+    return 0 if generate_report(analysis, args[0]) else 1
+
+# Tabela de comandos: nome -> (função, número mínimo de argumentos posicionais)
+_COMMANDS = {
+    'init': (_cmd_init, 0),
+    'create': (_cmd_create, 3),
+    'run': (_cmd_run, 0),
+    'analyze': (_cmd_analyze, 0),
+    'report': (_cmd_report, 1),
+}
 
 def main() -> int:
     """
@@ -423,48 +781,20 @@ def main() -> int:
         print('                        Cria novo teste', file=sys.stderr)
         print('  run [tipo] [categoria] [nome] [repetições]')
         print('                        Executa testes', file=sys.stderr)
-        print('  analyze [tipo] [início] [fim]')
+        print('  analyze [tipo] [início] [fim] [--no-cache] [--no-details]')
         print('                        Analisa resultados', file=sys.stderr)
-        print('  report <arquivo>')
+        print('  report <arquivo> [--no-cache] [--no-details]')
         print('                        Gera relatório', file=sys.stderr)
         return 1
 
-    command = sys.argv[1]
-
-    if command == 'init':
-        return 0 if create_test_directories() else 1
-
-    elif command == 'create' and len(sys.argv) > 4:
-        return 0 if create_test_template(
-            sys.argv[2],  # tipo
-            sys.argv[3],  # categoria
-            sys.argv[4]   # nome
-        ) else 1
-
-    elif command == 'run':
-        test_type = sys.argv[2] if len(sys.argv) > 2 else None
-        category = sys.argv[3] if len(sys.argv) > 3 else None
-        name = sys.argv[4] if len(sys.argv) > 4 else None
-        repeat = int(sys.argv[5]) if len(sys.argv) > 5 else 1
-
-        return 0 if run_tests(test_type, category, name, repeat) else 1
-
-    elif command == 'analyze':
-        test_type = sys.argv[2] if len(sys.argv) > 2 else None
-        start_time = sys.argv[3] if len(sys.argv) > 3 else None
-        end_time = sys.argv[4] if len(sys.argv) > 4 else None
-
-        analysis = analyze_results(test_type, start_time, end_time)
-        print_analysis(analysis)
-        return 0
-
-    elif command == 'report' and len(sys.argv) > 2:
-        analysis = analyze_results()
-        return 0 if generate_report(analysis, sys.argv[2]) else 1
-
-    else:
+    args = sys.argv[2:]
+    handler, min_args = _COMMANDS.get(sys.argv[1], (None, 0))
+    positional = [arg for arg in args if not arg.startswith('--')]
+    if handler is None or len(positional) < min_args:
         print('Comando inválido ou argumentos insuficientes.', file=sys.stderr)
         return 1
 
+    return handler(args)
+
 if __name__ == '__main__':
     sys.exit(main())
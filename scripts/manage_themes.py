@@ -5,31 +5,61 @@
 Script para gerenciar os temas da interface do emulador.
 """
 
-import json
 import os
-import shutil
+import string
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from manage_common import atomic_write_bytes, dump_json, loads, read_json
+
+# Cores de texto compartilhadas pelos temas escuros; as estruturas dos temas
+# padrão são só lidas e serializadas, nunca alteradas
+_DARK_TEXT = {
+    'primary': '#FFFFFF',
+    'secondary': '#B3FFFFFF',
+    'disabled': '#666666'
+}
+
+def _make_theme(name: str, description: str, colors: Dict, **sections: Dict) -> Dict:
+    """
+    Monta um tema padrão com os metadados comuns a todos eles.
+
+    Args:
+        name: Nome do tema.
+        description: Descrição do tema.
+        colors: Paleta de cores.
+        **sections: Seções adicionais (fontes, tamanhos, ícones).
+
+    Returns:
+        Dicionário do tema, com as chaves na ordem em que são gravadas.
+    """
+    return {
+        'name': name,
+        'description': description,
+        'version': '1.0.0',
+        'author': 'Mega Emu Team',
+        'colors': colors,
+        **sections
+    }
 
 # Estrutura padrão de um tema
-DEFAULT_THEME = {
-    'name': 'Default',
-    'description': 'Tema padrão do emulador',
-    'version': '1.0.0',
-    'author': 'Mega Emu Team',
-    'colors': {
+DEFAULT_THEME = _make_theme(
+    'Default',
+    'Tema padrão do emulador',
+    {
         'primary': '#2196F3',
         'secondary': '#FFC107',
         'background': '#121212',
         'surface': '#1E1E1E',
         'error': '#CF6679',
-        'text': {
-            'primary': '#FFFFFF',
-            'secondary': '#B3FFFFFF',
-            'disabled': '#666666'
-        },
+        'text': _DARK_TEXT,
         'button': {
             'background': '#2196F3',
             'text': '#FFFFFF',
@@ -49,12 +79,12 @@ DEFAULT_THEME = {
             'selected': '#2196F3'
         }
     },
-    'fonts': {
+    fonts={
         'primary': 'Roboto',
         'secondary': 'Open Sans',
         'monospace': 'Roboto Mono'
     },
-    'sizes': {
+    sizes={
         'text': {
             'small': '12px',
             'medium': '14px',
@@ -74,7 +104,7 @@ DEFAULT_THEME = {
             'circle': '50%'
         }
     },
-    'icons': {
+    icons={
         'menu': 'menu.svg',
         'close': 'close.svg',
         'settings': 'settings.svg',
@@ -85,26 +115,20 @@ DEFAULT_THEME = {
         'load': 'load.svg',
         'fullscreen': 'fullscreen.svg'
     }
-}
+)
 
 # Temas padrão adicionais
 DEFAULT_THEMES = {
-    'dark': {
-        'name': 'Dark',
-        'description': 'Tema escuro moderno',
-        'version': '1.0.0',
-        'author': 'Mega Emu Team',
-        'colors': {
+    'dark': _make_theme(
+        'Dark',
+        'Tema escuro moderno',
+        {
             'primary': '#BB86FC',
             'secondary': '#03DAC6',
             'background': '#121212',
             'surface': '#1E1E1E',
             'error': '#CF6679',
-            'text': {
-                'primary': '#FFFFFF',
-                'secondary': '#B3FFFFFF',
-                'disabled': '#666666'
-            },
+            'text': _DARK_TEXT,
             'button': {
                 'background': '#BB86FC',
                 'text': '#000000',
@@ -124,13 +148,11 @@ DEFAULT_THEMES = {
                 'selected': '#BB86FC'
             }
         }
-    },
-    'light': {
-        'name': 'Light',
-        'description': 'Tema claro e minimalista',
-        'version': '1.0.0',
-        'author': 'Mega Emu Team',
-        'colors': {
+    ),
+    'light': _make_theme(
+        'Light',
+        'Tema claro e minimalista',
+        {
             'primary': '#1976D2',
             'secondary': '#FFA000',
             'background': '#FFFFFF',
@@ -160,23 +182,17 @@ DEFAULT_THEMES = {
                 'selected': '#1976D2'
             }
         }
-    },
-    'retro': {
-        'name': 'Retro',
-        'description': 'Tema inspirado em consoles clássicos',
-        'version': '1.0.0',
-        'author': 'Mega Emu Team',
-        'colors': {
+    ),
+    'retro': _make_theme(
+        'Retro',
+        'Tema inspirado em consoles clássicos',
+        {
             'primary': '#E60012',
             'secondary': '#FFD700',
             'background': '#1A1B1E',
             'surface': '#2A2B2E',
             'error': '#FF0000',
-            'text': {
-                'primary': '#FFFFFF',
-                'secondary': '#B3FFFFFF',
-                'disabled': '#666666'
-            },
+            'text': _DARK_TEXT,
             'button': {
                 'background': '#E60012',
                 'text': '#FFFFFF',
@@ -196,9 +212,137 @@ DEFAULT_THEMES = {
                 'selected': '#E60012'
             }
         }
-    }
+    )
 }
 
+# Campos obrigatórios de um tema
+_REQUIRED_FIELDS = ('name', 'description', 'version', 'author', 'colors')
+
+# Cores obrigatórias de um tema
+_REQUIRED_COLORS = ('primary', 'secondary', 'background', 'surface', 'error',
+                    'text', 'button', 'input', 'menu')
+
+# Diretórios de temas instalados
+THEMES_DIR = Path('themes')
+ICONS_DIR = THEMES_DIR / 'icons'
+
+# Tabela para gerar o nome de arquivo de um tema em uma única passada:
+# minúsculas ASCII e espaços trocados por '_'
+_SLUG_TABLE = str.maketrans(string.ascii_uppercase + ' ',
+                            string.ascii_lowercase + '_')
+
+if msgspec is not None:
+    # Esquemas usados para decodificar e validar um tema em uma única passada;
+    # espelham os campos exigidos por validate_theme
+    class _ThemeColors(msgspec.Struct):
+        primary: Any
+        secondary: Any
+        background: Any
+        surface: Any
+        error: Any
+        text: Any
+        button: Any
+        input: Any
+        menu: Any
+
+    class _ThemeSchema(msgspec.Struct):
+        name: str
+        description: Any
+        version: Any
+        author: Any
+        colors: _ThemeColors
+        icons: Optional[Dict[str, str]] = None
+
+    # Só os campos exibidos por list_themes; o msgspec pula o restante do
+    # documento sem criar objetos para ele
+    class _ThemeMeta(msgspec.Struct):
+        name: Any
+        description: Any
+        version: Any
+        author: Any
+
+def _slug(name: str) -> str:
+    """
+    Converte o nome de um tema no nome do seu arquivo.
+
+    Args:
+        name: Nome do tema.
+
+    Returns:
+        Nome em minúsculas com espaços trocados por '_'.
+    """
+    if name.isascii():
+        return name.translate(_SLUG_TABLE)
+    # Letras fora do ASCII precisam das regras completas de lower()
+    return name.lower().replace(' ', '_')
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Grava um arquivo de forma atômica, a menos que ele já tenha esse conteúdo.
+
+    O tamanho é comparado antes, para não ler arquivos que certamente diferem.
+
+    Args:
+        path: Caminho do arquivo.
+        data: Conteúdo a gravar.
+
+    Returns:
+        True se o arquivo foi gravado, False se já estava atualizado.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+@lru_cache(maxsize=128)
+def _load_theme_cached(theme_path: str, mtime_ns: int) -> Dict:
+    """
+    Lê um arquivo de tema, memorizando o resultado por data de modificação.
+
+    Args:
+        theme_path: Caminho do arquivo de tema.
+        mtime_ns: Data de modificação do arquivo, usada apenas como chave do cache.
+
+    Returns:
+        Dicionário com o tema.
+    """
+    return read_json(theme_path)
+
+def _load_theme(theme_path: str) -> Dict:
+    """
+    Carrega um tema instalado para consulta, sem reler o arquivo se ele não mudou.
+
+    O dicionário retornado é compartilhado e não deve ser alterado.
+
+    Args:
+        theme_path: Caminho do arquivo de tema.
+
+    Returns:
+        Dicionário com o tema.
+    """
+    return _load_theme_cached(theme_path, os.stat(theme_path).st_mtime_ns)
+
+@lru_cache(maxsize=128)
+def _load_theme_meta(theme_path: str, mtime_ns: int) -> Tuple[Any, Any, Any, Any]:
+    """
+    Lê só os metadados de um tema, memorizando o resultado por data de modificação.
+
+    Args:
+        theme_path: Caminho do arquivo de tema.
+        mtime_ns: Data de modificação do arquivo, usada apenas como chave do cache.
+
+    Returns:
+        Tupla (nome, descrição, versão, autor).
+    """
+    if msgspec is not None:
+        meta = msgspec.json.decode(Path(theme_path).read_bytes(), type=_ThemeMeta)
+        return meta.name, meta.description, meta.version, meta.author
+    theme = _load_theme_cached(theme_path, mtime_ns)
+    return theme['name'], theme['description'], theme['version'], theme['author']
+
 def create_theme_directories() -> bool:
     """
     Cria a estrutura de diretórios para temas.
@@ -207,10 +351,8 @@ def create_theme_directories() -> bool:
         True se os diretórios foram criados com sucesso, False caso contrário.
     """
     try:
-        # Cria diretórios principais
-        dirs = ['themes', 'themes/icons']
-        for directory in dirs:
-            os.makedirs(directory, exist_ok=True)
+        # Cria diretórios principais; parents=True cria também THEMES_DIR
+        ICONS_DIR.mkdir(parents=True, exist_ok=True)
         return True
     except Exception as e:
         print(f'Erro ao criar diretórios: {e}', file=sys.stderr)
@@ -227,19 +369,82 @@ def validate_theme(theme: Dict) -> Tuple[bool, Optional[str]]:
         Uma tupla (válido, mensagem) onde válido é um booleano e mensagem é None
         se válido ou uma mensagem de erro caso contrário.
     """
-    required_fields = ['name', 'description', 'version', 'author', 'colors']
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in theme:
             return False, f'Campo obrigatório ausente: {field}'
 
-    required_colors = ['primary', 'secondary', 'background', 'surface', 'error',
-                      'text', 'button', 'input', 'menu']
-    for color in required_colors:
+    for color in _REQUIRED_COLORS:
         if color not in theme['colors']:
             return False, f'Cor obrigatória ausente: {color}'
 
     return True, None
 
+def _theme_type_error(theme: Any) -> Optional[str]:
+    """
+    Verifica os tipos dos campos de um tema, como os esquemas do msgspec.
+
+    Args:
+        theme: Tema decodificado.
+
+    Returns:
+        Mensagem de erro ou None se os tipos estiverem corretos.
+    """
+    if not isinstance(theme, dict):
+        return 'Tema deve ser um objeto JSON'
+    if 'name' in theme and not isinstance(theme['name'], str):
+        return 'Campo name deve ser um texto'
+    if 'colors' in theme and not isinstance(theme['colors'], dict):
+        return 'Campo colors deve ser um objeto'
+    icons = theme.get('icons')
+    if icons is not None and not (
+            isinstance(icons, dict) and
+            all(isinstance(icon, str) for icon in icons.values())):
+        return 'Campo icons deve mapear nomes para arquivos'
+    return None
+
+def _decode_theme(data: bytes) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Decodifica e valida um tema a instalar.
+
+    Com msgspec, ele decodifica e valida o tema contra _ThemeSchema. Sem
+    msgspec, ou se a validação falhar, usa _theme_type_error e validate_theme,
+    de modo que um tema é aceito ou recusado, com a mesma mensagem, com ou sem
+    msgspec instalado. O arquivo gravado sempre vem de dump_json, para que os
+    bytes não dependam do msgspec.
+
+    Args:
+        data: Conteúdo do arquivo de tema.
+
+    Returns:
+        Uma tupla (tema, mensagem) onde tema é um dicionário com 'name', 'icons'
+        e 'payload' (bytes a salvar), ou None se inválido, e mensagem é None se
+        válido ou uma mensagem de erro caso contrário.
+    """
+    valid = False
+    if msgspec is not None:
+        theme = msgspec.json.decode(data)
+        try:
+            msgspec.convert(theme, type=_ThemeSchema)
+            valid = True
+        except msgspec.ValidationError:
+            # A mensagem vem das verificações abaixo
+            pass
+    else:
+        theme = loads(data)
+
+    if not valid:
+        message = _theme_type_error(theme)
+        if message is None:
+            _, message = validate_theme(theme)
+        if message is not None:
+            return None, message
+
+    return {
+        'name': theme['name'],
+        'icons': theme.get('icons'),
+        'payload': dump_json(theme)
+    }, None
+
 def install_theme(theme_path: str) -> bool:
     """
     Instala um tema.
@@ -251,35 +456,51 @@ def install_theme(theme_path: str) -> bool:
         True se o tema foi instalado com sucesso, False caso contrário.
     """
     try:
-        # Verifica se o arquivo existe
-        if not os.path.exists(theme_path):
+        # Lê o tema
+        try:
+            data = Path(theme_path).read_bytes()
+        except FileNotFoundError:
             print(f'Arquivo não encontrado: {theme_path}', file=sys.stderr)
             return False
 
-        # Lê o tema
-        with open(theme_path, 'r', encoding='utf-8') as f:
-            theme = json.load(f)
-
         # Valida o tema
-        valid, message = validate_theme(theme)
-        if not valid:
+        theme, message = _decode_theme(data)
+        if theme is None:
             print(f'Tema inválido: {message}', file=sys.stderr)
             return False
 
         # Copia ícones se existirem
-        if 'icons' in theme:
+        if theme['icons']:
+            import shutil
+
             icons_dir = os.path.join(os.path.dirname(theme_path), 'icons')
             if os.path.exists(icons_dir):
+                # Ícones já instalados, para não copiar de novo os que não mudaram
+                with os.scandir(ICONS_DIR) as it:
+                    installed = {entry.name: entry.stat() for entry in it}
+
                 for icon_name in theme['icons'].values():
                     icon_path = os.path.join(icons_dir, icon_name)
-                    if os.path.exists(icon_path):
-                        shutil.copy2(icon_path, 'themes/icons')
+                    try:
+                        st = os.stat(icon_path)
+                    except FileNotFoundError:
+                        continue
+
+                    # A cópia é mais nova que o original e tem o mesmo tamanho
+                    icon_file = os.path.basename(icon_path)
+                    current = installed.get(icon_file)
+                    if (current is not None and current.st_size == st.st_size and
+                            current.st_mtime_ns >= st.st_mtime_ns):
+                        continue
+
+                    shutil.copyfile(icon_path, ICONS_DIR / icon_file)
 
         # Salva o tema
-        theme_name = theme['name'].lower().replace(' ', '_')
-        output_path = f'themes/{theme_name}.json'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(theme, f, indent=2, ensure_ascii=False)
+        theme_name = _slug(theme['name'])
+        output_path = THEMES_DIR / f'{theme_name}.json'
+        atomic_write_bytes(output_path, theme['payload'])
+        _load_theme_cached.cache_clear()
+        _load_theme_meta.cache_clear()
 
         print(f'Tema instalado: {theme["name"]}')
         return True
@@ -287,6 +508,21 @@ def install_theme(theme_path: str) -> bool:
         print(f'Erro ao instalar tema: {e}', file=sys.stderr)
         return False
 
+@lru_cache(maxsize=None)
+def _default_theme_payloads() -> Dict[str, bytes]:
+    """
+    Serializa os temas padrão uma única vez por processo.
+
+    Returns:
+        Dicionário id do tema -> conteúdo JSON, começando pelo tema padrão.
+    """
+    payloads = {'default': dump_json(DEFAULT_THEME)}
+    for theme_id, theme_data in DEFAULT_THEMES.items():
+        # Mescla com o tema padrão para garantir todos os campos; as seções
+        # aninhadas (cores, fontes, ...) são substituídas por inteiro
+        payloads[theme_id] = dump_json({**DEFAULT_THEME, **theme_data})
+    return payloads
+
 def install_default_themes() -> bool:
     """
     Instala os temas padrão.
@@ -295,18 +531,17 @@ def install_default_themes() -> bool:
         True se os temas foram instalados com sucesso, False caso contrário.
     """
     try:
-        # Instala o tema padrão
-        with open('themes/default.json', 'w', encoding='utf-8') as f:
-            json.dump(DEFAULT_THEME, f, indent=2, ensure_ascii=False)
-
-        # Instala os temas adicionais
-        for theme_id, theme_data in DEFAULT_THEMES.items():
-            # Mescla com o tema padrão para garantir todos os campos
-            theme = DEFAULT_THEME.copy()
-            theme.update(theme_data)
-
-            with open(f'themes/{theme_id}.json', 'w', encoding='utf-8') as f:
-                json.dump(theme, f, indent=2, ensure_ascii=False)
+        # Instala o tema padrão e os temas adicionais; os arquivos são
+        # independentes e as gravações se sobrepõem em threads
+        from concurrent.futures import ThreadPoolExecutor
+
+        THEMES_DIR.mkdir(exist_ok=True)
+        writes = [(THEMES_DIR / f'{theme_id}.json', payload)
+                  for theme_id, payload in _default_theme_payloads().items()]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda item: _write_if_changed(*item), writes))
+        _load_theme_cached.cache_clear()
+        _load_theme_meta.cache_clear()
 
         print('Temas padrão instalados com sucesso')
         return True
@@ -322,21 +557,32 @@ def list_themes() -> bool:
         True se a listagem foi bem sucedida, False caso contrário.
     """
     try:
-        themes_dir = 'themes'
-        if not os.path.exists(themes_dir):
+        try:
+            with os.scandir(THEMES_DIR) as it:
+                entries = sorted((entry for entry in it if entry.name.endswith('.json')),
+                                 key=lambda entry: entry.name)
+        except FileNotFoundError:
             print('Nenhum tema encontrado.')
             return True
 
+        # Lê os temas em paralelo; a impressão segue a ordem dos arquivos
+        if len(entries) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+                metas = list(executor.map(
+                    lambda entry: _load_theme_meta(entry.path, entry.stat().st_mtime_ns),
+                    entries))
+        else:
+            metas = [_load_theme_meta(entry.path, entry.stat().st_mtime_ns)
+                     for entry in entries]
+
         print('\nTemas instalados:')
-        for theme_file in sorted(os.listdir(themes_dir)):
-            if theme_file.endswith('.json'):
-                theme_path = os.path.join(themes_dir, theme_file)
-                with open(theme_path, 'r', encoding='utf-8') as f:
-                    theme = json.load(f)
-                print(f'\n{theme["name"]}:')
-                print(f'  Descrição: {theme["description"]}')
-                print(f'  Versão: {theme["version"]}')
-                print(f'  Autor: {theme["author"]}')
+        for name, description, version, author in metas:
+            print(f'\n{name}:')
+            print(f'  Descrição: {description}')
+            print(f'  Versão: {version}')
+            print(f'  Autor: {author}')
         return True
     except Exception as e:
         print(f'Erro ao listar temas: {e}', file=sys.stderr)
@@ -354,36 +600,44 @@ def remove_theme(theme_name: str) -> bool:
     """
     try:
         # Não permite remover o tema padrão
-        if theme_name.lower() == 'default':
+        slug = _slug(theme_name)
+        if slug == 'default':
             print('Não é possível remover o tema padrão.', file=sys.stderr)
             return False
 
-        theme_path = f'themes/{theme_name.lower()}.json'
-        if os.path.exists(theme_path):
-            # Remove o arquivo do tema
-            os.remove(theme_path)
-
-            # Remove ícones não utilizados por outros temas
-            if os.path.exists('themes/icons'):
-                used_icons = set()
-                # Coleta ícones usados por outros temas
-                for theme_file in os.listdir('themes'):
-                    if theme_file.endswith('.json') and theme_file != f'{theme_name.lower()}.json':
-                        with open(os.path.join('themes', theme_file), 'r', encoding='utf-8') as f:
-                            theme = json.load(f)
-                            if 'icons' in theme:
-                                used_icons.update(theme['icons'].values())
-
-                # Remove ícones não utilizados
-                for icon in os.listdir('themes/icons'):
-                    if icon not in used_icons:
-                        os.remove(os.path.join('themes/icons', icon))
-
-            print(f'Tema removido: {theme_name}')
-            return True
+        # Remove o arquivo do tema
+        theme_file = f'{slug}.json'
+        try:
+            (THEMES_DIR / theme_file).unlink()
+        except FileNotFoundError:
+            print(f'Tema não encontrado: {theme_name}', file=sys.stderr)
+            return False
 
-        print(f'Tema não encontrado: {theme_name}', file=sys.stderr)
-        return False
+        # Remove ícones não utilizados por outros temas
+        try:
+            with os.scandir(ICONS_DIR) as it:
+                icons = [(entry.name, entry.path) for entry in it]
+        except FileNotFoundError:
+            icons = []
+
+        if icons:
+            # Coleta ícones usados por outros temas
+            with os.scandir(THEMES_DIR) as it:
+                used_icons = {
+                    icon
+                    for entry in it
+                    if entry.name.endswith('.json') and entry.name != theme_file
+                    for icon in _load_theme_cached(
+                        entry.path, entry.stat().st_mtime_ns).get('icons', {}).values()
+                }
+
+            # Remove ícones não utilizados
+            for icon, icon_path in icons:
+                if icon not in used_icons:
+                    os.unlink(icon_path)
+
+        print(f'Tema removido: {theme_name}')
+        return True
     except Exception as e:
         print(f'Erro ao remover tema: {e}', file=sys.stderr)
         return False
@@ -400,31 +654,33 @@ def export_theme(theme_name: str, output_path: str) -> bool:
         True se o tema foi exportado com sucesso, False caso contrário.
     """
     try:
-        theme_file = f'themes/{theme_name.lower()}.json'
-        if not os.path.exists(theme_file):
+        slug = _slug(theme_name)
+
+        # Lê o tema
+        try:
+            theme = _load_theme(str(THEMES_DIR / f'{slug}.json'))
+        except FileNotFoundError:
             print(f'Tema não encontrado: {theme_name}', file=sys.stderr)
             return False
 
         # Cria diretório de saída
-        os.makedirs(output_path, exist_ok=True)
-        icons_dir = os.path.join(output_path, 'icons')
-        os.makedirs(icons_dir, exist_ok=True)
-
-        # Copia o tema
-        with open(theme_file, 'r', encoding='utf-8') as f:
-            theme = json.load(f)
+        output_dir = Path(output_path)
+        icons_dir = output_dir / 'icons'
+        icons_dir.mkdir(parents=True, exist_ok=True)
 
         # Copia os ícones
         if 'icons' in theme:
+            import shutil
+
             for icon_name in theme['icons'].values():
-                icon_path = os.path.join('themes/icons', icon_name)
-                if os.path.exists(icon_path):
-                    shutil.copy2(icon_path, icons_dir)
+                icon_path = ICONS_DIR / icon_name
+                try:
+                    shutil.copyfile(icon_path, icons_dir / icon_path.name)
+                except FileNotFoundError:
+                    continue
 
         # Salva o tema
-        output_file = os.path.join(output_path, f'{theme_name.lower()}.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(theme, f, indent=2, ensure_ascii=False)
+        atomic_write_bytes(output_dir / f'{slug}.json', dump_json(theme))
 
         print(f'Tema exportado para: {output_path}')
         return True
@@ -432,6 +688,88 @@ def export_theme(theme_name: str, output_path: str) -> bool:
         print(f'Erro ao exportar tema: {e}', file=sys.stderr)
         return False
 
+def _cmd_init(args: List[str]) -> int:
+    """
+    Comando init: cria os diretórios de temas.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if create_theme_directories() else 1
+
+def _cmd_install(args: List[str]) -> int:
+    """
+    Comando install: instala um tema.
+
+    Args:
+        args: [caminho do tema].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if install_theme(args[0]) else 1
+
+def _cmd_install_defaults(args: List[str]) -> int:
+    """
+    Comando install-defaults: instala os temas padrão.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if install_default_themes() else 1
+
+def _cmd_list(args: List[str]) -> int:
+    """
+    Comando list: lista os temas instalados.
+
+    Args:
+        args: Argumentos do comando (não usados).
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if list_themes() else 1
+
+def _cmd_remove(args: List[str]) -> int:
+    """
+    Comando remove: remove um tema.
+
+    Args:
+        args: [nome do tema].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if remove_theme(args[0]) else 1
+
+def _cmd_export(args: List[str]) -> int:
+    """
+    Comando export: exporta um tema para um arquivo.
+
+    Args:
+        args: [nome do tema, caminho de destino].
+
+    Returns:
+        0 em caso de sucesso, 1 caso contrário.
+    """
+    return 0 if export_theme(args[0], args[1]) else 1
+
+# Tabela de comandos: nome -> (função, número mínimo de argumentos)
+_COMMANDS = {
+    'init': (_cmd_init, 0),
+    'install': (_cmd_install, 1),
+    'install-defaults': (_cmd_install_defaults, 0),
+    'list': (_cmd_list, 0),
+    'remove': (_cmd_remove, 1),
+    'export': (_cmd_export, 2),
+}
+
 def main() -> int:
     """
     Função principal.
@@ -450,29 +788,12 @@ def main() -> int:
         print('  export <tema> <dir>   Exporta um tema', file=sys.stderr)
         return 1
 
-    command = sys.argv[1]
-
-    if command == 'init':
-        return 0 if create_theme_directories() else 1
-
-    elif command == 'install' and len(sys.argv) > 2:
-        return 0 if install_theme(sys.argv[2]) else 1
-
-    elif command == 'install-defaults':
-        return 0 if install_default_themes() else 1
-
-    elif command == 'list':
-        return 0 if list_themes() else 1
-
-    elif command == 'remove' and len(sys.argv) > 2:
-        return 0 if remove_theme(sys.argv[2]) else 1
-
-    elif command == 'export' and len(sys.argv) > 3:
-        return 0 if export_theme(sys.argv[2], sys.argv[3]) else 1
-
-    else:
+    handler, min_args = _COMMANDS.get(sys.argv[1], (None, 0))
+    if handler is None or len(sys.argv) < 2 + min_args:
         print('Comando inválido ou argumentos insuficientes.', file=sys.stderr)
         return 1
 
+    return handler(sys.argv[2:])
+
 if __name__ == '__main__':
     sys.exit(main())
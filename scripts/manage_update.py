@@ -7,17 +7,35 @@ Script para gerenciar os recursos de atualização do emulador.
 
 import os
 import sys
-import json
+import base64
+import re
+import glob
+import fnmatch
 import shutil
 import logging
 import logging.handlers
 import subprocess
+import time
 import hashlib
+import mmap
 import requests
+import requests.adapters
 import semver
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from manage_common import atomic_write_bytes, dumps, loads, read_json
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PublicKey
+    )
+except ImportError:
+    InvalidSignature = None
+    Ed25519PublicKey = None
 
 # Configurações de atualização
 UPDATE_CONFIG = {
@@ -55,7 +73,9 @@ UPDATE_CONFIG = {
     'verification': {
         'enabled': True,
         'algorithms': ['sha256', 'sha512'],
-        'signature': True
+        'signature': True,
+        # Chave pública Ed25519 (base64) que assina o sha256 do pacote
+        'public_key': None
     },
     'backup': {
         'enabled': True,
@@ -89,6 +109,80 @@ UPDATE_CONFIG = {
     }
 }
 
+# Padrões de tag de cada canal, compilados uma única vez
+_CHANNEL_RE = {
+    name: re.compile(channel['pattern'])
+    for name, channel in UPDATE_CONFIG['releases']['channels'].items()
+}
+
+# Padrão do pacote de cada plataforma, por prefixo de sys.platform
+_PLATFORM_RE = (
+    ('win', re.compile(r'.*\.exe$')),
+    ('linux', re.compile(r'.*\.AppImage$')),
+    ('darwin', re.compile(r'.*\.dmg$'))
+)
+
+def _compile_backup_patterns(include: List[str], exclude: List[str]) -> \
+        Tuple[Dict[str, 're.Pattern[str]'], 're.Pattern[str]']:
+    """
+    Compila os padrões do backup.
+
+    Os padrões de inclusão são agrupados por diretório, para que cada
+    diretório seja listado uma única vez; os de exclusão valem para o nome
+    de cada arquivo.
+
+    Args:
+        include: Padrões de inclusão ('diretório/padrão').
+        exclude: Padrões de exclusão.
+
+    Returns:
+        Tupla (regex de nomes por diretório, regex de exclusão).
+    """
+    names: Dict[str, List[str]] = {}
+    for pattern in include:
+        directory, name = os.path.split(pattern)
+        names.setdefault(directory or '.', []).append(fnmatch.translate(name))
+
+    include_re = {
+        directory: re.compile('|'.join(patterns))
+        for directory, patterns in names.items()
+    }
+    exclude_re = re.compile(
+        '|'.join(fnmatch.translate(e) for e in exclude) or '(?!)'
+    )
+    return include_re, exclude_re
+
+_BACKUP_INCLUDE_RE, _BACKUP_EXCLUDE_RE = _compile_backup_patterns(
+    UPDATE_CONFIG['backup']['include'],
+    UPDATE_CONFIG['backup']['exclude']
+)
+
+# Cache da listagem de releases do GitHub
+RELEASES_CACHE_PATH = os.path.join(
+    UPDATE_CONFIG['directories']['update'],
+    'releases.cache.json'
+)
+
+# Tamanho dos blocos lidos ao calcular hashes do pacote
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Tamanho dos blocos copiados ao baixar o pacote
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Pacotes a partir deste tamanho são mapeados em memória para o hash
+_MMAP_MIN_SIZE = 16 << 20
+
+# Tamanho mínimo para enviar dicas de leitura sequencial ao kernel
+_FADVISE_MIN_SIZE = 1 << 20
+
+# Sessão HTTP compartilhada, reaproveitando conexões entre requisições
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'megaemu-updater'
+SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8
+))
+
 def create_directories() -> bool:
     """
     Cria a estrutura de diretórios necessária.
@@ -118,6 +212,98 @@ def get_current_version() -> str:
         print(f'Erro ao obter versão atual: {e}', file=sys.stderr)
         return '0.0.0'
 
+def _load_releases_cache() -> Dict[str, Any]:
+    """
+    Carrega o cache da listagem de releases.
+
+    Returns:
+        Dados do cache ou dicionário vazio se não existir ou for inválido.
+    """
+    try:
+        cache = read_json(RELEASES_CACHE_PATH)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_releases_cache(cache: Dict[str, Any]) -> None:
+    """
+    Salva o cache da listagem de releases de forma atômica.
+
+    Args:
+        cache: Dados do cache.
+    """
+    os.makedirs(os.path.dirname(RELEASES_CACHE_PATH), exist_ok=True)
+    atomic_write_bytes(RELEASES_CACHE_PATH, dumps(cache))
+
+def _fetch_releases() -> List[Dict[str, Any]]:
+    """
+    Obtém a listagem de releases do GitHub, revalidando o cache local.
+
+    A requisição envia o ETag e a data da última resposta; se o GitHub
+    responder 304, a listagem em cache é reaproveitada sem baixar o corpo.
+    Com o limite da API esgotado, o cache é usado até o reset do limite.
+
+    Returns:
+        Lista de releases.
+    """
+    cache = _load_releases_cache()
+    cached_releases = cache.get('releases')
+
+    # Respeita o limite de requisições da API
+    if cached_releases is not None and \
+       cache.get('rate_limit_remaining') == 0 and \
+       time.time() < cache.get('rate_limit_reset', 0):
+        return cached_releases
+
+    headers = {}
+    if cached_releases is not None:
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+
+    config = UPDATE_CONFIG['repository']['github']
+    response = SESSION.get(
+        f'https://api.github.com/repos/{config["owner"]}/{config["repo"]}/releases',
+        headers=headers
+    )
+
+    if response.status_code == 304 and cached_releases is not None:
+        releases = cached_releases
+        changed = False
+    else:
+        response.raise_for_status()
+        releases = loads(response.content)
+        cache = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'releases': releases
+        }
+        changed = True
+
+    # Registra o limite restante para as próximas verificações
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    reset = response.headers.get('X-RateLimit-Reset')
+    if remaining is not None and reset is not None:
+        rate_limit = {
+            'rate_limit_remaining': int(remaining),
+            'rate_limit_reset': int(reset)
+        }
+        if any(cache.get(k) != v for k, v in rate_limit.items()):
+            cache.update(rate_limit)
+            changed = True
+
+    if changed:
+        # O cache é só uma otimização: falhar ao gravá-lo não impede a
+        # verificação de atualizações
+        try:
+            _save_releases_cache(cache)
+        except OSError as e:
+            print(f'Aviso: não foi possível salvar o cache de releases: {e}',
+                  file=sys.stderr)
+
+    return releases
+
 def check_for_updates(channel: str = 'stable') -> Optional[str]:
     """
     Verifica se há atualizações disponíveis.
@@ -131,29 +317,21 @@ def check_for_updates(channel: str = 'stable') -> Optional[str]:
     try:
         print(f'\nVerificando atualizações no canal {channel}...')
 
-        # Obtém configuração do canal
-        if channel not in UPDATE_CONFIG['releases']['channels']:
+        # Obtém padrão de tag do canal
+        pattern = _CHANNEL_RE.get(channel)
+        if pattern is None:
             print(f'Canal inválido: {channel}', file=sys.stderr)
             return None
 
-        channel_config = UPDATE_CONFIG['releases']['channels'][channel]
-
         # Obtém versão atual
         current_version = get_current_version()
         if not current_version:
             return None
 
         # Obtém releases do GitHub
-        config = UPDATE_CONFIG['repository']['github']
-        response = requests.get(
-            f'https://api.github.com/repos/{config["owner"]}/{config["repo"]}/releases'
-        )
-        response.raise_for_status()
-        releases = response.json()
+        releases = _fetch_releases()
 
         # Filtra releases pelo canal
-        import re
-        pattern = re.compile(channel_config['pattern'])
         valid_releases = [
             r for r in releases
             if pattern.match(r['tag_name']) and
@@ -164,18 +342,18 @@ def check_for_updates(channel: str = 'stable') -> Optional[str]:
             print('Nenhuma versão encontrada.')
             return None
 
-        # Obtém versão mais recente
-        latest_release = max(
-            valid_releases,
-            key=lambda r: semver.VersionInfo.parse(
-                r['tag_name'].lstrip('v')
-            )
+        # Obtém versão mais recente, interpretando cada tag uma única vez
+        latest_release, latest_info = max(
+            (
+                (r, semver.VersionInfo.parse(r['tag_name'].lstrip('v')))
+                for r in valid_releases
+            ),
+            key=lambda item: item[1]
         )
         latest_version = latest_release['tag_name'].lstrip('v')
 
         # Compara versões
-        if semver.VersionInfo.parse(latest_version) > \
-           semver.VersionInfo.parse(current_version):
+        if latest_info > semver.VersionInfo.parse(current_version):
             print(f'Nova versão disponível: {latest_version}')
             return latest_version
         else:
@@ -186,6 +364,33 @@ def check_for_updates(channel: str = 'stable') -> Optional[str]:
         print(f'Erro ao verificar atualizações: {e}', file=sys.stderr)
         return None
 
+def _backup_file(source: str, dest: str, previous: Optional[str]) -> None:
+    """
+    Copia um arquivo para o backup.
+
+    Se o arquivo não mudou desde o backup anterior (mesmo tamanho e data
+    de modificação), cria um hardlink para a cópia anterior em vez de
+    duplicar o conteúdo.
+
+    Args:
+        source: Caminho do arquivo original.
+        dest: Caminho do arquivo no novo backup.
+        previous: Caminho do arquivo no backup anterior, se houver.
+    """
+    if previous:
+        try:
+            source_stat = os.stat(source)
+            previous_stat = os.stat(previous)
+            if source_stat.st_size == previous_stat.st_size and \
+               source_stat.st_mtime_ns == previous_stat.st_mtime_ns:
+                os.link(previous, dest)
+                return
+        except OSError:
+            # Sem backup anterior ou sistema de arquivos sem hardlinks
+            pass
+
+    shutil.copy2(source, dest)
+
 def create_backup() -> Optional[str]:
     """
     Cria backup dos arquivos.
@@ -194,40 +399,73 @@ def create_backup() -> Optional[str]:
         Caminho do backup ou None em caso de erro.
     """
     try:
-        if not UPDATE_CONFIG['backup']['enabled']:
+        backup_config = UPDATE_CONFIG['backup']
+        backup_root = UPDATE_CONFIG['directories']['backup']
+        if not backup_config['enabled']:
             return None
 
         print('\nCriando backup...')
 
         # Gera nome do backup
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir = os.path.join(
-            UPDATE_CONFIG['directories']['backup'],
-            f'backup_{timestamp}'
-        )
+        backup_dir = os.path.join(backup_root, f'backup_{timestamp}')
+
+        # Localiza backup anterior, cujos arquivos inalterados são reaproveitados
+        backups = sorted(Path(backup_root).glob('backup_*'))
+        previous_dir = str(backups[-1]) if backups else None
 
         # Cria diretório de backup
         os.makedirs(backup_dir)
 
-        # Copia arquivos
-        for pattern in UPDATE_CONFIG['backup']['include']:
-            for path in Path('.').glob(pattern):
-                if any(path.match(e) for e in UPDATE_CONFIG['backup']['exclude']):
+        # Enumera arquivos
+        exclude_re = _BACKUP_EXCLUDE_RE
+        copy_jobs = []
+        created_dirs = set()
+        for directory, include_re in _BACKUP_INCLUDE_RE.items():
+            for source_dir in glob.glob(directory):
+                try:
+                    entries = os.scandir(source_dir)
+                except NotADirectoryError:
                     continue
 
-                # Cria diretório de destino
-                dest = os.path.join(backup_dir, path)
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
-
-                # Copia arquivo
-                if path.is_file():
-                    shutil.copy2(path, dest)
+                with entries:
+                    for entry in entries:
+                        if not include_re.match(entry.name) or \
+                           exclude_re.match(entry.name) or \
+                           not entry.is_file():
+                            continue
+
+                        # Cria diretório de destino
+                        dest_dir = os.path.normpath(
+                            os.path.join(backup_dir, source_dir)
+                        )
+                        if dest_dir not in created_dirs:
+                            os.makedirs(dest_dir, exist_ok=True)
+                            created_dirs.add(dest_dir)
+
+                        previous = os.path.join(
+                            previous_dir, source_dir, entry.name
+                        ) if previous_dir else None
+                        copy_jobs.append((
+                            entry.path,
+                            os.path.join(dest_dir, entry.name),
+                            previous
+                        ))
+
+        # Copia arquivos em paralelo; copy2 libera o GIL durante a cópia
+        if copy_jobs:
+            workers = min(32, (os.cpu_count() or 4) * 4, len(copy_jobs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                copies = [
+                    executor.submit(_backup_file, source, dest, previous)
+                    for source, dest, previous in copy_jobs
+                ]
+                for copy in copies:
+                    copy.result()
 
         # Remove backups antigos
-        backups = sorted(
-            Path(UPDATE_CONFIG['directories']['backup']).glob('backup_*')
-        )
-        while len(backups) > UPDATE_CONFIG['backup']['max_backups']:
+        backups = sorted(Path(backup_root).glob('backup_*'))
+        while len(backups) > backup_config['max_backups']:
             shutil.rmtree(backups[0])
             backups.pop(0)
 
@@ -238,57 +476,174 @@ def create_backup() -> Optional[str]:
         print(f'Erro ao criar backup: {e}', file=sys.stderr)
         return None
 
-def verify_package(package_path: str) -> bool:
+def _update_hashes(hash_objs: List[Any], data: Any) -> None:
+    """
+    Alimenta todos os hashes com o arquivo inteiro, um algoritmo por thread.
+
+    Cada thread recebe uma única tarefa com todos os dados, evitando o custo
+    de sincronizar as threads a cada bloco.
+
+    Args:
+        hash_objs: Objetos de hash a atualizar.
+        data: Conteúdo completo do arquivo (mmap).
+    """
+    if len(hash_objs) == 1:
+        hash_objs[0].update(data)
+        return
+
+    # hashlib libera o GIL, então cada algoritmo roda em sua thread
+    with ThreadPoolExecutor(max_workers=len(hash_objs)) as executor:
+        updates = [
+            executor.submit(hash_obj.update, data) for hash_obj in hash_objs
+        ]
+        for update in updates:
+            update.result()
+
+def _compute_hashes(package_path: str, algorithms: List[str]) -> Dict[str, str]:
+    """
+    Calcula os hashes de um arquivo numa única leitura.
+
+    Args:
+        package_path: Caminho do arquivo.
+        algorithms: Algoritmos de hash a calcular.
+
+    Returns:
+        Dicionário com o hash hexadecimal de cada algoritmo.
+    """
+    hashers = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    hash_objs = list(hashers.values())
+
+    with open(package_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+
+        # Pede ao kernel leitura antecipada para sobrepor I/O e hash
+        if size >= _FADVISE_MIN_SIZE and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+
+        if size >= _MMAP_MIN_SIZE:
+            # Pacotes grandes são lidos direto do page cache, sem cópia
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                _update_hashes(hash_objs, mapped)
+        else:
+            # Pacotes pequenos são hasheados em sequência, reaproveitando o
+            # mesmo buffer em todas as leituras
+            buffer = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                for hash_obj in hash_objs:
+                    hash_obj.update(view[:read])
+
+    return {
+        algorithm: hash_obj.hexdigest()
+        for algorithm, hash_obj in hashers.items()
+    }
+
+def _load_public_key() -> Any:
+    """
+    Carrega a chave pública Ed25519 usada para verificar assinaturas.
+
+    Returns:
+        Chave pública ou None se nenhuma chave estiver configurada.
+
+    Raises:
+        RuntimeError: Se há chave configurada mas o pacote cryptography
+            não está instalado.
+    """
+    public_key = UPDATE_CONFIG['verification']['public_key']
+    if not public_key:
+        return None
+    if Ed25519PublicKey is None:
+        raise RuntimeError(
+            'verificação de assinatura requer o pacote cryptography'
+        )
+    return Ed25519PublicKey.from_public_bytes(base64.b64decode(public_key))
+
+def verify_package(package_path: str, strict: bool = False) -> bool:
     """
     Verifica integridade do pacote.
 
+    A assinatura é lida antes de qualquer hash. Com uma chave pública
+    configurada, ela assina o sha256 do pacote e basta calcular esse hash;
+    os demais algoritmos só são calculados no modo estrito. Sem chave, a
+    assinatura não pode ser verificada e todos os hashes são conferidos.
+
     Args:
         package_path: Caminho do pacote.
+        strict: Calcula todos os hashes mesmo com assinatura válida.
 
     Returns:
         True se o pacote é válido, False caso contrário.
     """
     try:
-        if not UPDATE_CONFIG['verification']['enabled']:
+        verification = UPDATE_CONFIG['verification']
+        if not verification['enabled']:
             return True
 
         print('\nVerificando pacote...')
 
-        # Verifica hashes
-        for algorithm in UPDATE_CONFIG['verification']['algorithms']:
+        algorithms = verification['algorithms']
+
+        # Lê hashes esperados
+        expected_hashes = {}
+        for algorithm in algorithms:
             hash_path = f'{package_path}.{algorithm}'
             if not os.path.exists(hash_path):
                 print(f'Hash {algorithm} não encontrado.')
                 return False
 
-            # Lê hash esperado
             with open(hash_path, 'r') as f:
-                expected_hash = f.read().strip().split()[0]
-
-            # Calcula hash atual
-            hash_obj = hashlib.new(algorithm)
-            with open(package_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hash_obj.update(chunk)
-            actual_hash = hash_obj.hexdigest()
+                expected_hashes[algorithm] = f.read().strip().split()[0]
 
-            if actual_hash != expected_hash:
-                print(f'Hash {algorithm} inválido.')
-                return False
-
-        # Verifica assinatura
-        if UPDATE_CONFIG['verification']['signature']:
+        # Lê assinatura antes de calcular qualquer hash
+        signature = None
+        public_key = None
+        if verification['signature']:
             sig_path = f'{package_path}.sig'
             if not os.path.exists(sig_path):
                 print('Assinatura não encontrada.')
                 return False
 
-            # Lê assinatura
             with open(sig_path, 'r') as f:
                 signature = f.read().strip()
+            public_key = _load_public_key()
+            if public_key is None:
+                print('Aviso: nenhuma chave pública configurada; assinatura '
+                      'não verificada, pacote não autenticado.',
+                      file=sys.stderr)
+
+        # Só uma assinatura verificável dispensa os demais hashes: se ela
+        # não conferir, o pacote é recusado antes de comparar os hashes
+        hash_algorithms = list(algorithms)
+        if public_key is not None:
+            if not strict:
+                hash_algorithms = ['sha256']
+            elif 'sha256' not in hash_algorithms:
+                hash_algorithms.append('sha256')
+        actual_hashes = _compute_hashes(package_path, hash_algorithms)
+
+        # Verifica assinatura
+        if public_key is not None:
+            try:
+                public_key.verify(
+                    base64.b64decode(signature),
+                    bytes.fromhex(actual_hashes['sha256'])
+                )
+            except (InvalidSignature, ValueError):
+                print('Assinatura inválida.')
+                return False
 
-            # Verifica assinatura
-            # Nota: Implementar verificação de assinatura
+        # Verifica hashes
+        for algorithm in algorithms:
+            if algorithm in actual_hashes and \
+               actual_hashes[algorithm] != expected_hashes[algorithm]:
+                print(f'Hash {algorithm} inválido.')
+                return False
 
         print('Pacote verificado com sucesso.')
         return True
@@ -297,6 +652,36 @@ def verify_package(package_path: str) -> bool:
         print(f'Erro ao verificar pacote: {e}', file=sys.stderr)
         return False
 
+def _download_package(url: str, path: str) -> None:
+    """
+    Baixa o pacote de atualização em streaming.
+
+    Args:
+        url: URL do pacote.
+        path: Caminho de destino.
+    """
+    response = SESSION.get(url, stream=True)
+    response.raise_for_status()
+
+    # Copia o corpo em blocos grandes, descomprimindo se necessário
+    response.raw.decode_content = True
+    with open(path, 'wb') as f:
+        shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+
+def _download_sidecar(url: str, path: str) -> None:
+    """
+    Baixa um arquivo auxiliar do pacote (hash ou assinatura).
+
+    Args:
+        url: URL do arquivo.
+        path: Caminho de destino.
+    """
+    response = SESSION.get(url)
+    response.raise_for_status()
+
+    with open(path, 'wb') as f:
+        f.write(response.content)
+
 def download_update(version: str) -> Optional[str]:
     """
     Baixa pacote de atualização.
@@ -312,27 +697,23 @@ def download_update(version: str) -> Optional[str]:
 
         # Obtém informações do release
         config = UPDATE_CONFIG['repository']['github']
-        response = requests.get(
+        response = SESSION.get(
             f'https://api.github.com/repos/{config["owner"]}/{config["repo"]}/releases/tags/v{version}'
         )
         response.raise_for_status()
-        release = response.json()
+        release = loads(response.content)
 
         # Determina asset correto para a plataforma
         platform = sys.platform
-        if platform.startswith('win'):
-            pattern = r'.*\.exe$'
-        elif platform.startswith('linux'):
-            pattern = r'.*\.AppImage$'
-        elif platform.startswith('darwin'):
-            pattern = r'.*\.dmg$'
-        else:
+        pattern = next(
+            (p for prefix, p in _PLATFORM_RE if platform.startswith(prefix)),
+            None
+        )
+        if pattern is None:
             print(f'Plataforma não suportada: {platform}', file=sys.stderr)
             return None
 
         # Encontra asset
-        import re
-        pattern = re.compile(pattern)
         asset = next(
             (a for a in release['assets'] if pattern.match(a['name'])),
             None
@@ -341,39 +722,31 @@ def download_update(version: str) -> Optional[str]:
             print('Pacote não encontrado para esta plataforma.')
             return None
 
-        # Baixa pacote
+        # Baixa pacote, hashes e assinatura em paralelo
         package_path = os.path.join(
             UPDATE_CONFIG['directories']['temp'],
             asset['name']
         )
-        response = requests.get(
-            asset['browser_download_url'],
-            stream=True
-        )
-        response.raise_for_status()
-
-        with open(package_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-
-        # Baixa hashes
-        for algorithm in UPDATE_CONFIG['verification']['algorithms']:
-            hash_url = f'{asset["browser_download_url"]}.{algorithm}'
-            response = requests.get(hash_url)
-            response.raise_for_status()
-
-            with open(f'{package_path}.{algorithm}', 'wb') as f:
-                f.write(response.content)
-
-        # Baixa assinatura
+        package_url = asset['browser_download_url']
+        sidecars = list(UPDATE_CONFIG['verification']['algorithms'])
         if UPDATE_CONFIG['verification']['signature']:
-            sig_url = f'{asset["browser_download_url"]}.sig'
-            response = requests.get(sig_url)
-            response.raise_for_status()
+            sidecars.append('sig')
 
-            with open(f'{package_path}.sig', 'wb') as f:
-                f.write(response.content)
+        with ThreadPoolExecutor(max_workers=len(sidecars) + 1) as executor:
+            package_future = executor.submit(
+                _download_package, package_url, package_path
+            )
+            sidecar_futures = [
+                executor.submit(
+                    _download_sidecar,
+                    f'{package_url}.{extension}',
+                    f'{package_path}.{extension}'
+                )
+                for extension in sidecars
+            ]
+            package_future.result()
+            for future in sidecar_futures:
+                future.result()
 
         print(f'Download concluído: {package_path}')
         return package_path
@@ -382,12 +755,15 @@ def download_update(version: str) -> Optional[str]:
         print(f'Erro ao baixar atualização: {e}', file=sys.stderr)
         return None
 
-def install_update(package_path: str) -> bool:
+def install_update(package_path: str, replace_process: bool = False) -> bool:
     """
     Instala pacote de atualização.
 
     Args:
         package_path: Caminho do pacote.
+        replace_process: Substitui o processo atual pelo instalador
+            (os.execv) quando ele é o último passo da atualização, ou seja,
+            no Windows e Linux e sem hook post_update.
 
     Returns:
         True se a instalação foi bem sucedida, False caso contrário.
@@ -395,27 +771,34 @@ def install_update(package_path: str) -> bool:
     try:
         print('\nInstalando atualização...')
 
+        hooks = UPDATE_CONFIG['hooks']
+
         # Executa hook pre_update
-        if UPDATE_CONFIG['hooks']['pre_update']:
-            subprocess.run(
-                UPDATE_CONFIG['hooks']['pre_update'],
-                check=True
-            )
+        if hooks['pre_update']:
+            subprocess.run(hooks['pre_update'], check=True)
 
-        # Instala pacote
+        # Determina instalador
+        installer = None
         if sys.platform.startswith('win'):
             # Executa instalador Windows
-            subprocess.run(
-                [package_path, '/VERYSILENT', '/NORESTART'],
-                check=True
-            )
+            installer = [package_path, '/VERYSILENT', '/NORESTART']
         elif sys.platform.startswith('linux'):
             # Executa AppImage
             os.chmod(package_path, 0o755)
-            subprocess.run(
-                [package_path, '--install'],
-                check=True
-            )
+            installer = [package_path, '--install']
+
+        # Instala pacote
+        if installer:
+            if replace_process and not hooks['post_update']:
+                # Nada resta a fazer depois do instalador: substitui o
+                # processo atual em vez de criar um processo filho
+                print('Iniciando instalador...')
+                sys.stdout.flush()
+                sys.stderr.flush()
+                logging.shutdown()
+                os.execv(package_path, installer)
+
+            subprocess.run(installer, check=True)
         elif sys.platform.startswith('darwin'):
             # Monta DMG e copia aplicativo
             subprocess.run(
@@ -433,11 +816,8 @@ def install_update(package_path: str) -> bool:
             )
 
         # Executa hook post_update
-        if UPDATE_CONFIG['hooks']['post_update']:
-            subprocess.run(
-                UPDATE_CONFIG['hooks']['post_update'],
-                check=True
-            )
+        if hooks['post_update']:
+            subprocess.run(hooks['post_update'], check=True)
 
         print('Atualização instalada com sucesso.')
         return True
@@ -454,12 +834,13 @@ def setup_logging() -> bool:
         True se a configuração foi bem sucedida, False caso contrário.
     """
     try:
-        if not UPDATE_CONFIG['logging']['enabled']:
+        logging_config = UPDATE_CONFIG['logging']
+        if not logging_config['enabled']:
             return True
 
         # Configura logger
         logger = logging.getLogger('update')
-        logger.setLevel(UPDATE_CONFIG['logging']['level'])
+        logger.setLevel(logging_config['level'])
 
         # Handler para arquivo
         log_path = os.path.join(
@@ -468,12 +849,12 @@ def setup_logging() -> bool:
         )
         handler = logging.handlers.TimedRotatingFileHandler(
             log_path,
-            when=UPDATE_CONFIG['logging']['rotation']['when'],
-            interval=UPDATE_CONFIG['logging']['rotation']['interval'],
-            backupCount=UPDATE_CONFIG['logging']['rotation']['backupCount']
+            when=logging_config['rotation']['when'],
+            interval=logging_config['rotation']['interval'],
+            backupCount=logging_config['rotation']['backupCount']
         )
         handler.setFormatter(logging.Formatter(
-            UPDATE_CONFIG['logging']['format']
+            logging_config['format']
         ))
         logger.addHandler(handler)
 
@@ -494,7 +875,9 @@ def main() -> int:
         print('\nComandos disponíveis:', file=sys.stderr)
         print('  init                  Cria estrutura de diretórios', file=sys.stderr)
         print('  check [canal]         Verifica atualizações', file=sys.stderr)
-        print('  update [canal]        Atualiza sistema', file=sys.stderr)
+        print('  update [canal] [--exec] [--strict]', file=sys.stderr)
+        print('                        Atualiza sistema (--exec substitui o processo pelo instalador,', file=sys.stderr)
+        print('                        --strict confere todos os hashes mesmo com assinatura válida)', file=sys.stderr)
         print('  backup               Cria backup', file=sys.stderr)
         print('\nCanais disponíveis:', file=sys.stderr)
         print('  stable               Canal estável', file=sys.stderr)
@@ -516,7 +899,10 @@ def main() -> int:
         return 0 if check_for_updates(channel) is not None else 1
 
     elif command == 'update':
-        channel = sys.argv[2] if len(sys.argv) > 2 else 'stable'
+        args = [a for a in sys.argv[2:] if not a.startswith('--')]
+        channel = args[0] if args else 'stable'
+        replace_process = '--exec' in sys.argv[2:]
+        strict = '--strict' in sys.argv[2:]
 
         # Verifica atualização
         version = check_for_updates(channel)
@@ -533,11 +919,11 @@ def main() -> int:
             return 1
 
         # Verifica pacote
-        if not verify_package(package_path):
+        if not verify_package(package_path, strict):
             return 1
 
         # Instala atualização
-        if not install_update(package_path):
+        if not install_update(package_path, replace_process):
             return 1
 
         return 0
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+Configuração comum dos testes dos scripts de gerenciamento.
+"""
+
+import sys
+from pathlib import Path
+
+# Os scripts não formam um pacote; são importados pelo diretório scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
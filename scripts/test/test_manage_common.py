@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Testes das funções compartilhadas de manage_common.py.
+"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+import manage_common
+
+def test_dump_and_read_json_round_trip(tmp_path):
+    """Texto em português é gravado em UTF-8 e lido de volta igual."""
+    path = tmp_path / 'dados.json'
+    data = {'nome': 'Configuração', 'valores': [1, 2]}
+
+    path.write_bytes(manage_common.dump_json(data))
+
+    assert 'Configuração' in path.read_text(encoding='utf-8')
+    assert manage_common.read_json(path) == data
+
+def test_atomic_write_replaces_content(tmp_path):
+    """O arquivo é substituído e nenhum temporário fica para trás."""
+    path = tmp_path / 'settings.json'
+    path.write_bytes(b'antigo')
+
+    manage_common.atomic_write_bytes(path, b'novo')
+
+    assert path.read_bytes() == b'novo'
+    assert os.listdir(tmp_path) == ['settings.json']
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason='permissões POSIX')
+def test_atomic_write_keeps_permissions(tmp_path):
+    """As permissões do arquivo existente são mantidas."""
+    path = tmp_path / 'settings.json'
+    path.write_bytes(b'antigo')
+    os.chmod(path, 0o600)
+
+    manage_common.atomic_write_bytes(path, b'novo')
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+def test_atomic_write_failure_removes_temporary(tmp_path, monkeypatch):
+    """Se a substituição falha, o original fica intacto e o temporário some."""
+    path = tmp_path / 'settings.json'
+    path.write_bytes(b'antigo')
+
+    def fail(src, dst):
+        raise OSError('disco cheio')
+
+    monkeypatch.setattr(manage_common.os, 'replace', fail)
+    with pytest.raises(OSError):
+        manage_common.atomic_write_bytes(path, b'novo')
+
+    assert path.read_bytes() == b'antigo'
+    assert os.listdir(tmp_path) == ['settings.json']
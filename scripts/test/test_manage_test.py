@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Testes da execução com pytest/SlipCover de manage_test.py.
+"""
+
+import os
+import subprocess
+
+import pytest
+
+import manage_test
+
+JUNIT_XML = '''<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="4" errors="1" failures="1" skipped="1">
+    <testcase classname="test_cpu" name="test_ok"/>
+    <testcase classname="test_cpu" name="test_falha">
+      <failure message="assert 1 == 2">pilha da falha</failure>
+    </testcase>
+    <testcase classname="test_cpu" name="test_erro">
+      <error message="fixture quebrada"/>
+    </testcase>
+    <testcase classname="test_cpu" name="test_ignorado">
+      <skipped message="sem ROM"/>
+    </testcase>
+  </testsuite>
+</testsuites>
+'''
+
+def test_result_from_junit(tmp_path):
+    """Falhas, erros e testes ignorados viram as listas do TestResult."""
+    path = tmp_path / 'junit.xml'
+    path.write_text(JUNIT_XML, encoding='utf-8')
+
+    result = manage_test._result_from_junit(str(path))
+
+    assert result.testsRun == 4
+    assert result.failures == [('test_cpu.test_falha', 'pilha da falha')]
+    assert result.errors == [('test_cpu.test_erro', 'fixture quebrada')]
+    assert result.skipped == [('test_cpu.test_ignorado', 'sem ROM')]
+    assert not result.wasSuccessful()
+
+@pytest.fixture
+def test_dirs(tmp_path, monkeypatch):
+    """Diretório de trabalho com as pastas de relatórios e cobertura."""
+    monkeypatch.chdir(tmp_path)
+    for key in ('reports', 'coverage'):
+        os.makedirs(manage_test.TEST_CONFIG['directories'][key])
+    return tmp_path
+
+def test_slipcover_ignores_stale_reports(test_dirs, monkeypatch, capsys):
+    """Se o SlipCover não gera relatórios, os de execuções antigas não valem."""
+    directories = manage_test.TEST_CONFIG['directories']
+    junit_path = os.path.join(directories['reports'], 'junit_unit.xml')
+    json_path = os.path.join(directories['coverage'], 'unit.json')
+    with open(junit_path, 'w', encoding='utf-8') as f:
+        f.write(JUNIT_XML)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write('{"summary": {"percent_covered": 100.0}}')
+
+    # Simula o SlipCover ausente: código 1 e nenhum relatório
+    monkeypatch.setattr(subprocess, 'run',
+                        lambda cmd: subprocess.CompletedProcess(cmd, 1))
+
+    config = manage_test.TEST_CONFIG['suites']['unit']
+    assert manage_test._run_tests_slipcover('unit', config) is None
+    assert not os.path.exists(junit_path)
+    assert not os.path.exists(json_path)
+    assert 'relatório não gerado' in capsys.readouterr().err
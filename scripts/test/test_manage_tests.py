@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cache de análise de resultados de manage_tests.py.
+"""
+
+import os
+
+import pytest
+
+import manage_tests
+
+RESULT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="cpu_{name}" tests="2" failures="1" skipped="0" time="0.5">
+    <testcase name="ok"/>
+    <testcase name="{name}">
+      <failure message="falhou {name}">pilha de {name}</failure>
+    </testcase>
+  </testsuite>
+</testsuites>
+'''
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    """Diretório de trabalho com a pasta de resultados dos testes unitários."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'tests' / 'unit' / 'results'
+    path.mkdir(parents=True)
+    return path
+
+def _write_result(results_dir, timestamp, name):
+    """Grava um arquivo de resultado JUnit com uma falha."""
+    path = results_dir / f'test_result_{timestamp}.xml'
+    path.write_text(RESULT_XML.format(name=name), encoding='utf-8')
+    return path
+
+def _details(analysis):
+    """Mapeia cada teste que falhou para o texto da falha."""
+    return {f['test']: f['details'] for f in analysis['failures']}
+
+def test_cache_reused_for_unchanged_files(results_dir, monkeypatch):
+    """Arquivos inalterados não são lidos de novo na segunda análise."""
+    _write_result(results_dir, '20240101_000000', 'a')
+    first = manage_tests.analyze_results('unit')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('arquivo em cache foi reanalisado')
+
+    monkeypatch.setattr(manage_tests, '_parse_result_file', fail)
+    second = manage_tests.analyze_results('unit')
+
+    assert second == first
+    assert second['failed'] == 1
+
+def test_changed_file_is_reparsed(results_dir):
+    """Um arquivo alterado invalida sua entrada no cache."""
+    path = _write_result(results_dir, '20240101_000000', 'a')
+    manage_tests.analyze_results('unit')
+
+    path.write_text(RESULT_XML.format(name='bb'), encoding='utf-8')
+    os.utime(path, ns=(1, 1))
+
+    assert set(_details(manage_tests.analyze_results('unit'))) == {'bb'}
+
+def test_no_details_run_keeps_cached_details(results_dir):
+    """Uma análise sem detalhes não apaga os detalhes guardados no cache."""
+    _write_result(results_dir, '20240101_000000', 'a')
+    assert _details(manage_tests.analyze_results('unit')) == {'a': 'pilha de a'}
+
+    # Arquivo novo força a regravação do cache numa execução sem detalhes
+    _write_result(results_dir, '20240102_000000', 'b')
+    assert _details(manage_tests.analyze_results('unit', details=False)) == {
+        'a': None,
+        'b': None
+    }
+
+    assert _details(manage_tests.analyze_results('unit')) == {
+        'a': 'pilha de a',
+        'b': 'pilha de b'
+    }
+
+def test_without_cache_nothing_is_written(results_dir):
+    """Com use_cache=False o arquivo de cache não é criado."""
+    _write_result(results_dir, '20240101_000000', 'a')
+    manage_tests.analyze_results('unit', use_cache=False)
+
+    assert not os.path.exists(manage_tests.ANALYSIS_CACHE_PATH)
+
+def test_many_files_are_parsed_in_parallel(results_dir):
+    """Com muitos arquivos, a análise em processos soma todos eles."""
+    names = [f'n{i}' for i in range(manage_tests._PARALLEL_MIN_FILES)]
+    for i, name in enumerate(names):
+        _write_result(results_dir, f'20240101_0000{i:02d}', name)
+
+    analysis = manage_tests.analyze_results('unit', use_cache=False)
+
+    assert analysis['total'] == 2 * len(names)
+    assert set(_details(analysis)) == set(names)
+
+def test_deleted_files_are_pruned_from_cache(results_dir):
+    """Entradas de arquivos de resultado apagados saem do cache."""
+    kept = _write_result(results_dir, '20240101_000000', 'a')
+    removed = _write_result(results_dir, '20240102_000000', 'b')
+    manage_tests.analyze_results('unit')
+
+    os.remove(removed)
+    manage_tests.analyze_results('unit')
+
+    assert set(manage_tests._load_analysis_cache()) == {str(kept)}
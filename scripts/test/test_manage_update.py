@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+Testes do cache de releases e da verificação de pacotes de manage_update.py.
+"""
+
+import base64
+import json
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('semver')
+
+import manage_update
+
+class _FakeResponse:
+    """Resposta HTTP mínima usada no lugar de requests.Response."""
+
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise manage_update.requests.HTTPError(str(self.status_code))
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Redireciona o cache de releases para um diretório temporário."""
+    path = tmp_path / 'update' / 'releases.cache.json'
+    monkeypatch.setattr(manage_update, 'RELEASES_CACHE_PATH', str(path))
+    return path
+
+def _serve(monkeypatch, responses):
+    """Faz SESSION.get devolver as respostas dadas, registrando os cabeçalhos."""
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr(manage_update.SESSION, 'get', fake_get)
+    return sent
+
+def test_fetch_releases_revalidates_with_etag(cache_path, monkeypatch):
+    """A segunda consulta envia o ETag e reaproveita o cache com 304."""
+    releases = [{'tag_name': 'v1.0.0'}]
+    sent = _serve(monkeypatch, [
+        _FakeResponse(200, json.dumps(releases).encode(), {'ETag': '"abc"'}),
+        _FakeResponse(304)
+    ])
+
+    assert manage_update._fetch_releases() == releases
+    assert manage_update._fetch_releases() == releases
+
+    assert 'If-None-Match' not in sent[0]
+    assert sent[1]['If-None-Match'] == '"abc"'
+
+def test_fetch_releases_survives_cache_write_error(cache_path, monkeypatch,
+                                                   capsys):
+    """Falhar ao gravar o cache só gera um aviso."""
+    releases = [{'tag_name': 'v1.0.0'}]
+    _serve(monkeypatch, [
+        _FakeResponse(200, json.dumps(releases).encode(), {'ETag': '"abc"'})
+    ])
+
+    def fail(cache):
+        raise PermissionError('somente leitura')
+
+    monkeypatch.setattr(manage_update, '_save_releases_cache', fail)
+
+    assert manage_update._fetch_releases() == releases
+    assert 'cache de releases' in capsys.readouterr().err
+
+def _make_package(tmp_path, signature='c2ln', hashes=None):
+    """Cria um pacote com os arquivos de hash e assinatura ao lado."""
+    package = tmp_path / 'megaemu.zip'
+    package.write_bytes(b'conteudo do pacote')
+    hashes = hashes or manage_update._compute_hashes(
+        str(package), ['sha256', 'sha512']
+    )
+    for algorithm, digest in hashes.items():
+        (tmp_path / f'megaemu.zip.{algorithm}').write_text(
+            f'{digest}  megaemu.zip\n'
+        )
+    (tmp_path / 'megaemu.zip.sig').write_text(signature)
+    return package, hashes
+
+def _use_key(monkeypatch, public_key):
+    """Configura a chave pública usada na verificação."""
+    verification = dict(manage_update.UPDATE_CONFIG['verification'])
+    verification['public_key'] = public_key
+    monkeypatch.setitem(manage_update.UPDATE_CONFIG, 'verification',
+                        verification)
+
+def test_verify_without_key_checks_all_hashes(tmp_path, monkeypatch, capsys):
+    """Sem chave, o sha512 continua conferido e o usuário é avisado."""
+    _use_key(monkeypatch, None)
+    package, hashes = _make_package(tmp_path)
+
+    assert manage_update.verify_package(str(package))
+    assert 'não autenticado' in capsys.readouterr().err
+
+    (tmp_path / 'megaemu.zip.sha512').write_text('0' * 128)
+    assert not manage_update.verify_package(str(package))
+
+def _signed_package(tmp_path, monkeypatch, tamper=False):
+    """Cria um pacote assinado com uma chave Ed25519 nova."""
+    ed25519 = pytest.importorskip(
+        'cryptography.hazmat.primitives.asymmetric.ed25519'
+    )
+    from cryptography.hazmat.primitives import serialization
+
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    raw = private_key.public_key().public_bytes(
+        serialization.Encoding.Raw, serialization.PublicFormat.Raw
+    )
+    _use_key(monkeypatch, base64.b64encode(raw).decode())
+
+    package, hashes = _make_package(tmp_path)
+    digest = hashes['sha256']
+    if tamper:
+        digest = '0' * 64
+    signature = private_key.sign(bytes.fromhex(digest))
+    (tmp_path / 'megaemu.zip.sig').write_text(
+        base64.b64encode(signature).decode()
+    )
+    return package
+
+def test_verify_with_valid_signature(tmp_path, monkeypatch):
+    """Com assinatura válida, só o modo estrito confere o sha512."""
+    package = _signed_package(tmp_path, monkeypatch)
+    (tmp_path / 'megaemu.zip.sha512').write_text('0' * 128)
+
+    assert manage_update.verify_package(str(package))
+    assert not manage_update.verify_package(str(package), strict=True)
+
+def test_verify_rejects_invalid_signature(tmp_path, monkeypatch):
+    """Uma assinatura que não confere recusa o pacote."""
+    package = _signed_package(tmp_path, monkeypatch, tamper=True)
+
+    assert not manage_update.verify_package(str(package))